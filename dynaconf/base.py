@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import copy
 import importlib
 import inspect
 import os
 import re
+import sys
+import threading
 import warnings
+import weakref
 from collections import defaultdict
 from contextlib import contextmanager
 from contextlib import suppress
@@ -14,6 +19,7 @@ from dataclasses import field
 from functools import lru_cache
 from functools import wraps
 from pathlib import Path
+from time import monotonic
 from typing import Any
 from typing import Callable
 from typing import Optional
@@ -25,14 +31,25 @@ from dynaconf.loaders import enable_external_loaders
 from dynaconf.loaders import env_loader
 from dynaconf.loaders import execute_instance_hooks
 from dynaconf.loaders import execute_module_hooks
+from dynaconf.loaders import prefetch_settings_files
 from dynaconf.loaders import py_loader
 from dynaconf.loaders import settings_loader
 from dynaconf.loaders import yaml_loader
 from dynaconf.loaders.base import SourceMetadata
 from dynaconf.nodes import DataDict
 from dynaconf.nodes import DataList
+from dynaconf.nodes import freeze_value
+from dynaconf.nodes import FrozenDict
+from dynaconf.nodes import has_lazy
+from dynaconf.nodes import holds_node
+from dynaconf.nodes import record_dependencies
+from dynaconf.nodes import record_dependency
+from dynaconf.nodes import resolve_value
+from dynaconf.nodes import tracking_dependencies
+from dynaconf.nodes import VOLATILE
 from dynaconf.strategies.filtering import PrefixFilter
 from dynaconf.utils import BANNER
+from dynaconf.utils import copy_structure
 from dynaconf.utils import ensure_a_list
 from dynaconf.utils import ensure_upperfied_list
 from dynaconf.utils import ListMergeOptions
@@ -41,9 +58,12 @@ from dynaconf.utils import normalize_kwargs
 from dynaconf.utils import object_merge
 from dynaconf.utils import RENAMED_VARS
 from dynaconf.utils import upperfy
+from dynaconf.utils.files import cached_listings
 from dynaconf.utils.files import find_file
 from dynaconf.utils.files import glob
 from dynaconf.utils.files import has_magic
+from dynaconf.utils.files import pinned_script_dir
+from dynaconf.utils.files import recording_probes
 from dynaconf.utils.functional import empty
 from dynaconf.utils.functional import LazyObject
 from dynaconf.utils.parse_conf import apply_converter
@@ -52,6 +72,10 @@ from dynaconf.utils.parse_conf import converters
 from dynaconf.utils.parse_conf import Lazy
 from dynaconf.utils.parse_conf import parse_conf_data
 from dynaconf.utils.parse_conf import true_values
+from dynaconf.utils.snapshot import plain
+from dynaconf.utils.snapshot import Snapshot
+from dynaconf.utils.snapshot import snapshot_key
+from dynaconf.utils.watch import FileWatcher
 from dynaconf.validator import ValidationError
 from dynaconf.validator import ValidatorList
 
@@ -91,11 +115,38 @@ class LazySettings(LazyObject):
                 self._wrapped = wrapped
 
     def __getattr__(self, name):
-        """Setup wrapped Setting instance on first access."""
+        """Setup wrapped Setting instance on first access.
+
+        Cached values are then bound on this proxy, so the following reads
+        are plain instance attribute lookups until the value is invalidated.
+        """
         if self._wrapped is empty:
             self._setup()
 
-        return getattr(self._wrapped, name)
+        value = getattr(self._wrapped, name)
+        if not name.startswith("_"):
+            core = getattr(self._wrapped, "__core__", None)
+            if core is not None:
+                core.bind(self, name, value)
+            elif isinstance(self._wrapped, FrozenSettings):
+                # frozen values never change, bind them for good
+                self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        if name == "_wrapped":
+            self._unbind_wrapped()
+        super().__setattr__(name, value)
+
+    def _unbind_wrapped(self):
+        """Drop the values bound on this proxy from the wrapped settings."""
+        wrapped = self.__dict__.get("_wrapped", empty)
+        if wrapped is empty:
+            return
+        with suppress(AttributeError):
+            wrapped.__core__.unbind(self)
+        for name in [n for n in self.__dict__ if not n.startswith("_")]:
+            del self.__dict__[name]
 
     def _setup(self):
         """Initial setup, run once."""
@@ -128,6 +179,8 @@ class LazySettings(LazyObject):
         self._wrapped = self._wrapper_class(
             settings_module=settings_module, **kwargs
         )
+        if self._wrapped.get("FROZEN_FOR_DYNACONF"):
+            self._wrapped = self._wrapped.freeze()
 
     @property
     def configured(self):
@@ -205,6 +258,162 @@ class DynaconfConfig:
         self.__post_init__()
 
 
+@dataclass
+class ResolvedOptions:
+    """Snapshot of the internal options consulted on every `Settings.get`.
+
+    Rebuilt by `DynaconfCore.refresh_options` whenever a `*_FOR_DYNACONF`
+    key is set or unset, so the read path doesn't need to resolve them.
+
+    For internal use only.
+    """
+
+    sysenv_fallback: Union[bool, list, None] = None
+    sysenv_fallback_keys: frozenset = frozenset()
+    nested_separator: Optional[str] = None
+    dotted_lookup: Optional[bool] = None
+    lowercase_read: Any = empty
+    fresh_vars_ttl: Union[float, dict, None] = None
+
+    def fresh_ttl(self, key) -> Optional[float]:
+        """The seconds `key` is served before a background refresh."""
+        if isinstance(self.fresh_vars_ttl, dict):
+            return self.fresh_vars_ttl.get(key)
+        return self.fresh_vars_ttl
+
+    @classmethod
+    def from_settings(cls, obj) -> ResolvedOptions:
+        sysenv_fallback = getattr(obj, "SYSENV_FALLBACK_FOR_DYNACONF", None)
+        sysenv_fallback_keys: frozenset = frozenset()
+        if isinstance(sysenv_fallback, list):
+            sysenv_fallback_keys = frozenset(
+                upperfy(k) for k in sysenv_fallback
+            )
+        fresh_vars_ttl = getattr(obj, "FRESH_VARS_TTL_FOR_DYNACONF", None)
+        if isinstance(fresh_vars_ttl, dict):
+            fresh_vars_ttl = {
+                upperfy(k): v for k, v in fresh_vars_ttl.items() if v
+            }
+        return cls(
+            sysenv_fallback=sysenv_fallback,
+            sysenv_fallback_keys=sysenv_fallback_keys,
+            nested_separator=getattr(
+                obj, "NESTED_SEPARATOR_FOR_DYNACONF", None
+            ),
+            dotted_lookup=getattr(obj, "DOTTED_LOOKUP_FOR_DYNACONF", None),
+            lowercase_read=getattr(obj, "LOWERCASE_READ_FOR_DYNACONF", empty),
+            fresh_vars_ttl=fresh_vars_ttl or None,
+        )
+
+
+class LayerStack:
+    """Ordered stack of the writes made by each source (`SourceMetadata`).
+
+    The store is the merged view of this stack: replaying, in order, the
+    writes made to a top-level key gives its value back. Consecutive writes
+    of the same source form a layer, so a source written more than once
+    (e.g. env vars loaded again after includes) keeps its precedence.
+
+    Each write is kept as `(key, raw_value, set_kwargs)`.
+
+    For internal use only.
+    """
+
+    def __init__(self):
+        # [(source, {root_key: [(key, value, kwargs), ...]})]
+        self.layers: list[tuple[Any, dict]] = []
+
+    def __len__(self):
+        return len(self.layers)
+
+    def record(self, source, root, key, value, kwargs, merge_enabled=False):
+        if self.layers and self.layers[-1][0] == source:
+            writes = self.layers[-1][1]
+        else:
+            writes = {}
+            self.layers.append((source, writes))
+        calls = writes.setdefault(root, [])
+        if calls and not _may_merge(key, value, kwargs, merge_enabled):
+            # a value which doesn't merge replaces what this source wrote
+            # before, so writing a key over and over keeps a single write
+            calls.clear()
+        calls.append((key, value, kwargs))
+
+    def writes(self, root):
+        """The writes made to the `root` key, in order."""
+        for _, writes in self.layers:
+            yield from writes.get(root, ())
+
+    def roots(self):
+        return {root for _, writes in self.layers for root in writes}
+
+    def discard(self, root):
+        """Forget every write made to `root`, e.g. when it is unset."""
+        for _, writes in self.layers:
+            writes.pop(root, None)
+        self.layers = [layer for layer in self.layers if layer[1]]
+
+    def pop_sources(self, match):
+        """Remove the layers of the sources matching `match(source)`.
+
+        Returns the index where their replacement must be inserted, the
+        position of the last removed layer, and the roots they wrote to.
+        """
+        index, roots, kept = None, set(), []
+        for source, writes in self.layers:
+            if match(source):
+                index = len(kept)
+                roots.update(writes)
+            else:
+                kept.append((source, writes))
+        self.layers = kept
+        return index, roots
+
+    def move_sources(self, start, match, index):
+        """Move the matching layers added after `start` to `index`.
+
+        Returns the roots written by the moved layers.
+        """
+        moved = [layer for layer in self.layers[start:] if match(layer[0])]
+        if not moved:
+            return set()
+        rest = [layer for layer in self.layers[start:] if not match(layer[0])]
+        del self.layers[start:]
+        if index is None:
+            index = start
+        self.layers[index:index] = moved
+        self.layers.extend(rest)
+        return {root for _, writes in moved for root in writes}
+
+    def clear(self):
+        self.layers.clear()
+
+
+def _may_merge(key, value, kwargs, merge_enabled=False) -> bool:
+    """If writing `value` to `key` may merge with the existing value,
+    following the rules of `Settings.set` and `_merge_before_set`.
+
+    :param merge_enabled: the `MERGE_ENABLED_FOR_DYNACONF` of the settings
+    """
+    if isinstance(key, str) and ("." in key or "[" in key or "__" in key):
+        return True
+    merge = kwargs.get("merge", empty)
+    if isinstance(value, str):
+        if value.lstrip().startswith("@"):
+            return True
+        if not kwargs.get("tomlfy"):
+            return False
+        # may be parsed into a dict or a list holding a merge mark
+        marked = "dynaconf_merge" in value
+    elif isinstance(value, (dict, list, tuple)):
+        marked = "dynaconf_merge" in value or "dynaconf_merge_unique" in value
+    else:
+        return merge is True
+    if merge is empty:
+        merge = merge_enabled
+    return bool(merge) or marked
+
+
 class DynaconfCore:
     """Developer-facing settings manager."""
 
@@ -221,31 +430,338 @@ class DynaconfCore:
         store = kwargs.pop("_store", default_store)
         validators = kwargs.pop("validators", None)
 
-        self._cache: dict = {}
+        self._init_caches()
         self.obj = obj
         self.config = config
-        self.store = store
+        self.options = ResolvedOptions()
+        self._store = store
+        self.generation = 0
+        # set by `Settings.resolve_lazy` while the store has no Lazy values
+        self.lazy_resolved = False
+        self.layers = LayerStack()
         self.validators = ValidatorList(obj, validators=validators)
 
+    # STORE
+
+    @property
+    def store(self):
+        """The published store, or the one being built by `swapping_store`
+        when called from within it."""
+        staged = _staged_stores.get()
+        if staged and id(self) in staged:
+            return staged[id(self)][0]
+        return self._store
+
+    @store.setter
+    def store(self, value):
+        self._store = value
+
+    @property
+    def deleted(self):
+        """The deleted keys, staged along with the store."""
+        staged = _staged_stores.get()
+        if staged and id(self) in staged:
+            return staged[id(self)][1]
+        return self.config.deleted
+
+    def is_staging(self):
+        staged = _staged_stores.get()
+        return bool(staged) and id(self) in staged
+
+    @contextmanager
+    def swapping_store(self, keys=None):
+        """Build a new store off to the side and publish it atomically.
+
+        Within the block the current context reads and writes a shallow copy
+        of the store, other threads and tasks keep reading the published one
+        until it is replaced by a single reference swap on exit.
+        When `keys` are given only those are published into the current
+        store, one assignment each. Nothing is published if the block raises.
+        """
+        if self.is_staging():  # nested reload/setenv, already staging
+            yield
+            return
+
+        store = self._store
+        if isinstance(store, DataDict):
+            staged_store = store.copy(bypass_eval=True)
+        else:
+            staged_store = store.copy()
+        staged_deleted = set(self.config.deleted)
+        token = _staged_stores.set(
+            {
+                **(_staged_stores.get() or {}),
+                id(self): (staged_store, staged_deleted),
+            }
+        )
+        try:
+            yield
+        finally:
+            _staged_stores.reset(token)
+
+        # other writers don't see a half published store
+        with self._write_lock:
+            self.generation += 1
+            if keys is None:
+                self._store = staged_store
+                self.config.deleted = staged_deleted
+                self.clear_cache()
+                self.clear_lazy_cache()
+                return
+
+            token = _publishing.set(True)
+            try:
+                for key in keys:
+                    if key in staged_store:
+                        self._store[key] = dict.__getitem__(staged_store, key)
+                    else:
+                        self._store.pop(key, None)
+                    if key in staged_deleted:
+                        self.config.deleted.add(key)
+                    else:
+                        self.config.deleted.discard(key)
+                    self.invalidate_cached(key)
+                    self.invalidate_lazy(key)
+            finally:
+                _publishing.reset(token)
+
+    # LAYERS
+
+    @contextmanager
+    def replacing_layers(self, match):
+        """Replace the layers of the sources matching `match(source)`.
+
+        The writes those sources make within the block become their new
+        layers, at the position of the old ones, and only the top-level keys
+        written by the old or the new layers are computed again from the
+        stack and published.
+        """
+        index, roots = self.layers.pop_sources(match)
+        start = len(self.layers)
+        with self.swapping_store(keys=roots):
+            yield
+            roots.update(self.layers.move_sources(start, match, index))
+            self.recompute(roots)
+
+    def recompute(self, roots):
+        """Compute `roots` again by replaying their writes in stack order."""
+        token = _layer_writes.set(_REPLAYING)
+        try:
+            for root in roots:
+                self.store.pop(root, None)
+                self.invalidate_cached(root)
+                self.invalidate_lazy(root)
+                for key, value, kwargs in self.layers.writes(root):
+                    self.obj.set(key, copy_structure(value), **kwargs)
+        finally:
+            _layer_writes.reset(token)
+
+    # FRESH VARS
+
+    def revalidate(self, key, ttl) -> bool:
+        """Stale-while-revalidate policy for the `key` fresh var.
+
+        Returns False when `key` was never refreshed and the caller must
+        load it. Otherwise the current value can be served, and when it is
+        older than `ttl` seconds a single background refresh is started.
+        """
+        refreshed_at = self._refreshed_at.get(key)
+        if refreshed_at is None:
+            return False
+        if monotonic() - refreshed_at < ttl:
+            return True
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return True
+            self._refreshing.add(key)
+        threading.Thread(
+            target=self._refresh,
+            args=(key,),
+            name=f"dynaconf-refresh-{key}",
+            daemon=True,
+        ).start()
+        return True
+
+    def mark_refreshed(self, key):
+        self._refreshed_at[key] = monotonic()
+
+    def _refresh(self, key):
+        try:
+            with self._write_lock, self.swapping_store(keys=(key,)):
+                self.obj.unset(key)
+                self.obj.execute_loaders(key=key)
+        except Exception as err:
+            # keep serving the last good value until the next attempt
+            warnings.warn(f"Failed to refresh fresh var {key!r}: {err}")
+        finally:
+            self.mark_refreshed(key)
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
     # CACHING
 
+    def _init_caches(self):
+        self._cache: dict = {}
+        # key -> the top-level keys its cached value was computed from
+        self._cache_dependencies: dict = {}
+        self._cache_dependents: defaultdict = defaultdict(set)
+        self._bound_keys: set = set()
+        self._bound_proxies: weakref.WeakValueDictionary = (
+            weakref.WeakValueDictionary()
+        )
+        self._lazy_cache: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lazy_dependents: defaultdict = defaultdict(weakref.WeakSet)
+        self._refreshed_at: dict = {}
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        # held by the writers (set, unset, reloads and the background
+        # refresh) so they don't interleave on the layers and history
+        self._write_lock = threading.RLock()
+
     def get_cached(self, key):
+        """Return the cached value of `key`.
+
+        The keys the value was computed from are recorded as dependencies
+        of the Lazy value being evaluated, as if it was computed again.
+        """
         if not cache_enabled:
             raise KeyError  # communicates "cache not found"
-        return self._cache[key]
+        value = self._cache[key]
+        record_dependencies(self._cache_dependencies[key])
+        return value
 
-    def set_cached(self, key, value):
-        if not cache_enabled:
+    def _cache_root(self, key):
+        """Return the top-level key under which `key` is invalidated."""
+        if not isinstance(key, str):
+            return key
+        nested_sep = self.options.nested_separator
+        if nested_sep and nested_sep in key:
+            key = key.replace(nested_sep, ".")
+        return upperfy(re.split(r"[.\[]", key, maxsplit=1)[0].strip())
+
+    def set_cached(self, key, value, dependencies=(), generation=None):
+        """Cache `value` under `key` until `key` or a dependency changes.
+
+        `dependencies` are the top-level keys read to compute the value,
+        `generation` the store generation it was computed from.
+        """
+        if not self._can_cache(generation) or VOLATILE in dependencies:
             return
         fresh_vars = self.config.fresh_vars
         is_lazy = value.__class__.__name__ == "Lazy"
         if key not in fresh_vars and not is_lazy:
+            root = self._cache_root(key)
+            self._cache_dependencies[key] = frozenset((root, *dependencies))
             self._cache[key] = value
+            self._cache_dependents[root].add(key)
+            for dependency in dependencies:
+                self._cache_dependents[dependency].add(key)
+
+    def invalidate_cached(self, key):
+        """Drop the cached values of `key` and the ones which have read it.
+
+        Dotted and nested keys (`a.b`, `A__B`) are scoped to the top-level.
+        """
+        for cached_key in self._cache_dependents.pop(
+            self._cache_root(key), ()
+        ):
+            self._cache.pop(cached_key, None)
+            self._cache_dependencies.pop(cached_key, None)
+            if cached_key in self._bound_keys:
+                self._bound_keys.discard(cached_key)
+                for proxy in self._bound_proxies.values():
+                    proxy.__dict__.pop(cached_key, None)
 
     def clear_cache(self):
         if not cache_enabled:
             return
+        for proxy in self._bound_proxies.values():
+            self._unbind_keys(proxy)
+        self._bound_keys.clear()
         self._cache.clear()
+        self._cache_dependencies.clear()
+        self._cache_dependents.clear()
+
+    def store_changed(self, node):
+        """Drop the cached values read from `node` after it was changed in
+        place, i.e, the ones of the top-level keys holding it.
+
+        Nodes not in the store (e.g, the copies returned for lists) change
+        nothing. The writes made by `Settings.set` and by `swapping_store`
+        are skipped, they invalidate their own keys.
+        """
+        if _layer_writes.get() or _publishing.get():
+            return
+        if not (self._cache or self._lazy_cache):
+            return
+        for key, value in list(dict.items(self.store)):
+            if holds_node(value, node):
+                self.invalidate_cached(key)
+                self.invalidate_lazy(key)
+
+    def _can_cache(self, generation=None):
+        # values computed from a store being built or already replaced by
+        # `swapping_store` must not be visible to other readers
+        if not cache_enabled or self.is_staging():
+            return False
+        return generation is None or generation == self.generation
+
+    def bind(self, proxy, key, value):
+        """Bind a cached `value` as an attribute of a LazySettings `proxy`.
+
+        The attribute is dropped from the proxy when the key is invalidated.
+        """
+        if self.is_staging():
+            return
+        if key in self._cache and self._cache[key] is value:
+            proxy.__dict__[key] = value
+            self._bound_keys.add(key)
+            self._bound_proxies[id(proxy)] = proxy
+
+    def unbind(self, proxy):
+        """Drop every attribute bound on `proxy`."""
+        self._unbind_keys(proxy)
+        self._bound_proxies.pop(id(proxy), None)
+
+    def _unbind_keys(self, proxy):
+        for key in self._bound_keys:
+            proxy.__dict__.pop(key, None)
+
+    # LAZY CACHING
+
+    def _lazy_cache_enabled(self):
+        # hooks can change the values read while evaluating a Lazy value
+        return cache_enabled and not self.obj.__dict__.get("_registered_hooks")
+
+    def get_lazy_cached(self, lazy):
+        """Return the (result, dependencies) of an evaluated Lazy value."""
+        if not self._lazy_cache_enabled():
+            raise KeyError  # communicates "cache not found"
+        return self._lazy_cache[lazy]
+
+    def set_lazy_cached(self, lazy, value, dependencies, generation=None):
+        if not self._lazy_cache_enabled() or not self._can_cache(generation):
+            return
+        self._lazy_cache[lazy] = (value, dependencies)
+        for key in dependencies:
+            self._lazy_dependents[key].add(lazy)
+
+    def invalidate_lazy(self, key):
+        """Drop the evaluated Lazy values which have read `key`."""
+        for lazy in self._lazy_dependents.pop(key, ()):
+            self._lazy_cache.pop(lazy, None)
+
+    def clear_lazy_cache(self):
+        self._lazy_cache.clear()
+        self._lazy_dependents.clear()
+
+    # OPTIONS
+
+    def refresh_options(self):
+        """Rebuild the options snapshot from the current internal keys."""
+        self.options = ResolvedOptions.from_settings(self.obj)
 
     # COPYING
 
@@ -256,15 +772,73 @@ class DynaconfCore:
         memo[id(self)] = new_instance
 
         for key, value in self.__dict__.items():
-            if key != "_cache":
+            if key not in _CORE_CACHE_ATTRS:
                 setattr(new_instance, key, copy.deepcopy(value, memo))
 
-        new_instance._cache = {}
+        new_instance._init_caches()
         return new_instance
 
+    def __getstate__(self):
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in _CORE_CACHE_ATTRS
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
+
+
+_staged_stores: contextvars.ContextVar = contextvars.ContextVar(
+    "_staged_stores", default=None
+)
+"""Maps id(core) -> the store being built by `DynaconfCore.swapping_store`."""
+
+_layer_writes: contextvars.ContextVar = contextvars.ContextVar(
+    "_layer_writes", default=False
+)
+"""Set while `Settings.set` runs or replays, its inner writes aren't layers."""
+
+_publishing: contextvars.ContextVar = contextvars.ContextVar(
+    "_publishing", default=False
+)
+"""Set while `DynaconfCore.swapping_store` publishes the staged keys."""
+
+_REPLAYING = "replaying"
+
+# positional arguments of `Settings.set` after `key` and `value`
+_SET_ARGUMENTS = (
+    "loader_identifier",
+    "tomlfy",
+    "dotted_lookup",
+    "is_secret",
+    "validate",
+    "merge",
+    "tomlfy_filter",
+)
+
+_CORE_CACHE_ATTRS = (
+    "_cache",
+    "_cache_dependencies",
+    "_cache_dependents",
+    "_refreshed_at",
+    "_refreshing",
+    "_refresh_lock",
+    "_write_lock",
+    "_bound_keys",
+    "_bound_proxies",
+    "_lazy_cache",
+    "_lazy_dependents",
+)
+
 
 def invalidates_cache(func):
-    """Decorator that clears the cache before calling the decorated method."""
+    """Decorator that clears the whole cache before calling the decorated
+    method, used on env switches and reloads.
+
+    Methods changing a single key call `DynaconfCore.invalidate_cached`.
+    """
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -278,6 +852,46 @@ def invalidates_cache(func):
     return wrapper
 
 
+def records_layer(func):
+    """Decorator recording the `Settings.set` calls in `core.layers`.
+
+    Only the outermost call is recorded, the writes it makes itself
+    (dotted keys, `@del`) and the ones replayed by `recompute` are not.
+    """
+
+    @wraps(func)
+    def wrapper(self, key, value, *args, **kwargs):
+        if _layer_writes.get():
+            return func(self, key, value, *args, **kwargs)
+        core = self.__core__
+        raw_value = copy_structure(value)
+        with core._write_lock:
+            token = _layer_writes.set(True)
+            try:
+                result = func(self, key, value, *args, **kwargs)
+            finally:
+                _layer_writes.reset(token)
+            kwargs = {**dict(zip(_SET_ARGUMENTS, args)), **kwargs}
+            source = kwargs.get("loader_identifier")
+            if not isinstance(source, SourceMetadata):
+                source = SourceMetadata("set_method", source or "undefined")
+            # validation belongs to the original call, not to its replays
+            kwargs["validate"] = False
+            core.layers.record(
+                source,
+                core._cache_root(key),
+                key,
+                raw_value,
+                kwargs,
+                merge_enabled=getattr(
+                    self, "MERGE_ENABLED_FOR_DYNACONF", False
+                ),
+            )
+        return result
+
+    return wrapper
+
+
 class Settings:
     """User-facing settings object."""
 
@@ -316,8 +930,9 @@ class Settings:
         skip_loaders = kwargs.get("dynaconf_skip_loaders", False)
         skip_validators = kwargs.get("dynaconf_skip_validators", False)
 
+        snapshot = None
         if not skip_loaders:
-            self.execute_loaders()
+            snapshot = self._load_or_restore(kwargs)
 
         if not skip_validators:
             core.validators.validate(
@@ -326,6 +941,12 @@ class Settings:
                 only_current_env=config.validate_only_current_env,
             )
 
+        if snapshot is not None:
+            snapshot.write()
+
+        if self.get("RESOLVE_LAZY_FOR_DYNACONF") == "eager":
+            self.resolve_lazy()
+
     @property
     def environ(self):
         return os.environ
@@ -348,7 +969,8 @@ class Settings:
         try:
             if key != "__core__":
                 core = self.__core__
-                return core.get_cached(key)
+                value = core.get_cached(key)
+                return value
         except KeyError:
             pass
 
@@ -364,10 +986,12 @@ class Settings:
             value = core.store.__getattribute__(key)
         # Use regular .get which triggers hooks among other things
         else:
-            value = self.get(key, default=empty)
+            generation = core.generation
+            with tracking_dependencies() as dependencies:
+                value = self.get(key, default=empty)
             if value is empty:
                 raise AttributeError(key)
-            core.set_cached(key, value)
+            core.set_cached(key, value, dependencies, generation)
         return value
 
     def __getitem__(self, key):
@@ -377,21 +1001,27 @@ class Settings:
         try:
             if key != "__core__":
                 core = self.__core__
-                return core.get_cached(key)
+                value = core.get_cached(key)
+                return value
         except KeyError:
             pass
 
         # Use regular .get which triggers hooks among other things
-        value = self.get(key, default=empty)
+        generation = core.generation
+        with tracking_dependencies() as dependencies:
+            value = self.get(key, default=empty)
         if value is empty:
             raise KeyError(f"{key} does not exist")
-        core.set_cached(key, value)
+        core.set_cached(key, value, dependencies, generation)
         return value
 
-    @invalidates_cache
     def __setattr__(self, name, value):
         """Allow `settings.FOO = 'value'` while keeping internal attrs."""
         if name in RESERVED_ATTRS:
+            # using getattr because before Settings init it's unset
+            core = getattr(self, "__core__", None)
+            if core:
+                core.clear_cache()
             super().__setattr__(name, value)
         else:
             self.set(name, value)
@@ -400,21 +1030,22 @@ class Settings:
         """Allow `settings['KEY'] = 'value'`"""
         self.__setattr__(key, value)
 
-    @invalidates_cache
     def __delattr__(self, name):
         """stores reference in `_deleted` for proper error management"""
-        self.__core__.config.deleted.add(name)
+        self.__core__.deleted.add(name)
+        self.__core__.invalidate_cached(name)
         if hasattr(self, name):
             super().__delattr__(name)
+            if name.endswith("_FOR_DYNACONF"):
+                self.__core__.refresh_options()
 
-    @invalidates_cache
     def __delitem__(self, name):
-        self.__core__.config.deleted.add(name)
+        self.__core__.deleted.add(name)
         self.set(name, "@del")
 
     def __contains__(self, item):
         """Respond to `item in settings`"""
-        nested_sep = getattr(self, "NESTED_SEPARATOR_FOR_DYNACONF", None)
+        nested_sep = self.__core__.options.nested_separator
 
         if isinstance(item, str) and nested_sep and nested_sep in item:
             item = item.replace(nested_sep, ".")
@@ -453,7 +1084,6 @@ class Settings:
         """Redirects to store object"""
         return self.store.values()
 
-    @invalidates_cache
     def setdefault(
         self, item, default, apply_default_on_none=False, env: str = "unknown"
     ):
@@ -526,39 +1156,59 @@ class Settings:
         :param default: In case of not found it will be returned
         :param parent: Is there a pre-loaded parent in a nested data?
         """
-        split_key = dotted_key.split(".")
-        name, keys = split_key[0], split_key[1:]
-        result = self.get(name, default=default, parent=parent, **kwargs)
-
-        # If we've reached the end, or parent key not found, then return result
-        if not keys or result == default:
-            if cast and cast in converters:
-                return apply_converter(cast, result, box_settings=self)
-            elif cast is True:
-                return parse_conf_data(
-                    result,
-                    tomlfy=True,
-                    box_settings=self,
-                    tomlfy_filter=tomlfy_filter,
+        core = self.__core__
+        # Only lookups from the root without a default are cached, otherwise
+        # a missing key would be cached as the default given to the call.
+        cacheable = (
+            parent is None and default is None and not kwargs.get("fresh")
+        )
+        try:
+            if not cacheable:
+                raise KeyError
+            result = core.get_cached(dotted_key)
+        except KeyError:
+            generation = core.generation
+            with tracking_dependencies() as dependencies:
+                result = self._traverse_dotted(
+                    dotted_key, default=default, parent=parent, **kwargs
                 )
-            return result
-
-        # Still keys left, but current result/parent is not a data container
-        if keys and not isinstance(result, (dict, list)):
-            result_type = type(result).__name__
-            raise AttributeError(
-                f"Invalid dotted lookup in {dotted_key}. {name} is a {result_type}"
+            if cacheable and result is not None:
+                core.set_cached(dotted_key, result, dependencies, generation)
+
+        if cast and cast in converters:
+            return apply_converter(cast, result, box_settings=self)
+        elif cast is True:
+            return parse_conf_data(
+                result,
+                tomlfy=True,
+                box_settings=self,
+                tomlfy_filter=tomlfy_filter,
             )
+        return result
 
-        # If we've still got key elements to traverse, let's do that.
-        return self._dotted_get(
-            ".".join(keys),
-            default=default,
-            parent=result,
-            cast=cast,
-            tomlfy_filter=tomlfy_filter,
-            **kwargs,
-        )
+    def _traverse_dotted(
+        self, dotted_key, default=None, parent=None, **kwargs
+    ):
+        """Walk the parsed `dotted_key` path down from `parent` (or root)."""
+        path = _split_dotted_key(dotted_key)
+        last = len(path) - 1
+        result = parent
+        for depth, name in enumerate(path):
+            result = self.get(name, default=default, parent=result, **kwargs)
+
+            # parent key not found, return the default
+            if depth == last or result == default:
+                break
+
+            # Still keys left, but current result is not a data container
+            if not isinstance(result, (dict, list)):
+                result_type = type(result).__name__
+                remaining_key = ".".join(path[depth:])
+                raise AttributeError(
+                    f"Invalid dotted lookup in {remaining_key}. "
+                    f"{name} is a {result_type}"
+                )
+        return result
 
     def get(
         self,
@@ -587,21 +1237,23 @@ class Settings:
         """
         core = self.__core__
         config = core.config
+        options = core.options
+        sysenv_fallback_keys = options.sysenv_fallback_keys
         if sysenv_fallback is None:
-            sysenv_fallback = getattr(
-                self, "SYSENV_FALLBACK_FOR_DYNACONF", None
+            sysenv_fallback = options.sysenv_fallback
+        elif isinstance(sysenv_fallback, list):
+            sysenv_fallback_keys = frozenset(
+                upperfy(k) for k in sysenv_fallback
             )
 
-        nested_sep = getattr(self, "NESTED_SEPARATOR_FOR_DYNACONF", None)
+        nested_sep = options.nested_separator
         if isinstance(key, str):
             if nested_sep and nested_sep in key:
                 # turn FOO__bar__ZAZ in `FOO.bar.ZAZ`
                 key = key.replace(nested_sep, ".")
 
             if dotted_lookup is empty:
-                dotted_lookup = getattr(
-                    self, "DOTTED_LOOKUP_FOR_DYNACONF", None
-                )
+                dotted_lookup = options.dotted_lookup
 
             if "." in key and dotted_lookup:
                 return self._dotted_get(
@@ -613,14 +1265,18 @@ class Settings:
                 )
 
             key = upperfy(key)
+            if parent is None:
+                record_dependency(key)
 
         # handles system environment fallback
-        if default is None:
-            key_in_sysenv_fallback_list = isinstance(
-                sysenv_fallback, list
-            ) and key in [upperfy(k) for k in sysenv_fallback]
+        if default is None and sysenv_fallback:
+            key_in_sysenv_fallback_list = (
+                isinstance(sysenv_fallback, list)
+                and key in sysenv_fallback_keys
+            )
             if sysenv_fallback is True or key_in_sysenv_fallback_list:
                 default = self.get_environ(key, cast=True)
+                record_dependency(key, volatile=True)
 
         # default values should behave exactly Dynaconf parsed values
         # NOTE: is this really required?
@@ -630,14 +1286,19 @@ class Settings:
             elif isinstance(default, dict):
                 default = DataDict(default)
 
-        if key in config.deleted:
+        if key in core.deleted:
             return default
 
         if (
             fresh or config.fresh or key in config.fresh_vars
         ) and key not in UPPER_DEFAULT_SETTINGS:
-            self.unset(key)
-            self.execute_loaders(key=key)
+            record_dependency(key, volatile=True)
+            ttl = None if fresh or config.fresh else options.fresh_ttl(key)
+            if ttl is None or not core.revalidate(key, ttl):
+                self.unset(key)
+                self.execute_loaders(key=key)
+                if ttl is not None:
+                    core.mark_refreshed(key)
 
         data = _get_with_default(parent or core.store, key, default)
         if cast:
@@ -652,11 +1313,10 @@ class Settings:
         :return: Boolean
         """
         key = upperfy(key)
-        if key in self.__core__.config.deleted:
+        if key in self.__core__.deleted:
             return False
         return self.get(key, fresh=fresh, default=missing) is not missing
 
-    @invalidates_cache
     def get_fresh(self, key, default=None, cast=None):
         """This is a shortcut to `get(key, fresh=True)`. always reload from
         loaders store before getting the var.
@@ -668,7 +1328,23 @@ class Settings:
         """
         return self.get(key, default=default, cast=cast, fresh=True)
 
-    @invalidates_cache
+    async def aget_fresh(self, key, default=None, cast=None):
+        """Async counterpart of `get_fresh`, the loaders are awaited.
+
+        :param key: The name of the setting value, will always be upper case
+        :param default: In case of not found it will be returned
+        :param cast: Should cast in to @int, @float, @bool or @json ?
+        :return: The value if found, default or None
+        """
+        core = self.__core__
+        root_key = core._cache_root(key)
+        if root_key not in UPPER_DEFAULT_SETTINGS:
+            # other tasks keep reading the current value while loading
+            with core.swapping_store(keys=(root_key,)):
+                self.unset(root_key)
+                await self.aload(key=root_key)
+        return self.get(key, default=default, cast=cast)
+
     def get_environ(self, key, default=None, cast=None):
         """Get value from environment variable using os.environ.get
 
@@ -803,7 +1479,8 @@ class Settings:
         config.env_cache[cache_key] = new_settings
 
         # update source metadata for inspecting
-        self.loaded_by_loaders.update(new_settings.loaded_by_loaders)
+        with self.__core__._write_lock:
+            self.loaded_by_loaders.update(new_settings.loaded_by_loaders)
 
         return new_settings
 
@@ -953,9 +1630,13 @@ class Settings:
         else:
             self.loaded_envs = []
 
-        if clean:
-            self.clean(env=env)
-        self.execute_loaders(env=env, silent=silent, filename=filename)
+        # readers keep the current values until the new env is fully loaded
+        core = self.__core__
+        with core._write_lock, core.swapping_store():
+            if clean:
+                self.clean(env=env)
+                self.__core__.layers.clear()
+            self.execute_loaders(env=env, silent=silent, filename=filename)
 
     # compat
     namespace = setenv
@@ -963,30 +1644,35 @@ class Settings:
     @invalidates_cache
     def clean(self, *args, **kwargs):
         """Clean all loaded values to reload when switching envs"""
+        self.__core__.clear_lazy_cache()
         for key in list(self.store.keys()):
             self.unset(key)
 
-    @invalidates_cache
     def unset(self, key, force=False):
         """Unset on all references
 
         :param key: The key to be unset
         :param force: Bypass default checks and force unset
         """
-        config = self.__core__.config
+        core = self.__core__
+        config = core.config
         key = upperfy(key.strip())
-        if (
-            key not in UPPER_DEFAULT_SETTINGS
-            and key not in config.defaults
-            or force
-        ):
-            with suppress(KeyError, AttributeError):
-                # AttributeError can happen when a LazyValue consumes
-                # a previously deleted key
-                delattr(self, key)
-                del self.store[key]
+        with core._write_lock:
+            core.invalidate_cached(key)
+            core.invalidate_lazy(key)
+            if (
+                key not in UPPER_DEFAULT_SETTINGS
+                and key not in config.defaults
+                or force
+            ):
+                if not _layer_writes.get():
+                    core.layers.discard(key)
+                with suppress(KeyError, AttributeError):
+                    # AttributeError can happen when a LazyValue consumes
+                    # a previously deleted key
+                    delattr(self, key)
+                    del self.store[key]
 
-    @invalidates_cache
     def unset_all(self, keys, force=False):  # pragma: no cover
         """Unset based on a list of keys
 
@@ -1115,7 +1801,7 @@ class Settings:
             **kwargs,
         )
 
-    @invalidates_cache
+    @records_layer
     def set(
         self,
         key,
@@ -1261,12 +1947,21 @@ class Settings:
 
         # Set the parsed value
         self.store[key] = parsed
-        config.deleted.discard(key)
+        core.deleted.discard(key)
+        core.invalidate_lazy(key)
+        if core.lazy_resolved and has_lazy(parsed):
+            core.lazy_resolved = False
 
         # only use super().__setattr__ (uses the 'object' class setattr)
         # with internal values. Other values should go to internal store
         if _is_key_internal(key):
             super().__setattr__(key, parsed)
+            if key.endswith("_FOR_DYNACONF"):
+                core.refresh_options()
+            # internal keys may change how every other key is read
+            core.clear_cache()
+        else:
+            core.invalidate_cached(key)
 
         # Track history for inspect, store the raw_value
         if source_metadata in self.loaded_by_loaders:
@@ -1282,7 +1977,6 @@ class Settings:
         if validate is True:
             core.validators.validate()
 
-    @invalidates_cache
     def update(
         self,
         data=None,
@@ -1407,15 +2101,182 @@ class Settings:
     @invalidates_cache
     def reload(self, env=None, silent=None):  # pragma: no cover
         """Clean end Execute all loaders"""
+        core = self.__core__
+        # readers keep the current values until everything is reloaded
+        with core._write_lock, core.swapping_store():
+            self._clean_for_reload()
+            self.execute_loaders(env, silent)
+            if self.get("RESOLVE_LAZY_FOR_DYNACONF") == "eager":
+                self.resolve_lazy()
+
+    async def areload(self, env=None, silent=None):
+        """Async counterpart of `reload`, the loaders are awaited.
+
+        The write lock is not held across the awaits, the loaders take it
+        on each write, and the new store is published and the cache cleared
+        under it once everything is reloaded.
+        """
+        core = self.__core__
+        # readers keep the current values until everything is reloaded
+        with core.swapping_store():
+            with core._write_lock:
+                self._clean_for_reload()
+            await self.aload(env, silent)
+            if self.get("RESOLVE_LAZY_FOR_DYNACONF") == "eager":
+                self.resolve_lazy()
+
+    def reload_files(self, paths):
+        """Re-read only `paths` and re-merge the keys they define.
+
+        The layers of `paths` are replaced in `core.layers`, the keys
+        written by them before or after the change are computed again from
+        the other layers, so no other source is read, the precedence of the
+        other files, env vars and loaders is kept and only those keys are
+        invalidated.
+
+        :param paths: a filename or a list of filenames already loaded
+        """
+        core = self.__core__
+        config = core.config
+        paths = {os.path.abspath(str(p)) for p in ensure_a_list(paths)}
+
+        def from_paths(source):
+            identifier = getattr(source, "identifier", None)
+            return (
+                isinstance(identifier, str)
+                and os.path.abspath(identifier) in paths
+            )
+
+        with core._write_lock:
+            # the history of `paths` is recorded again while loading them
+            for source in list(config.loaded_by_loaders):
+                if from_paths(source):
+                    del config.loaded_by_loaders[source]
+
+            loaded_files = list(config.loaded_files)
+            with core.replacing_layers(from_paths):
+                for path in paths:
+                    settings_loader(
+                        self, env=self.current_env, silent=True, filename=path
+                    )
+            config.loaded_files[:] = loaded_files
+
+    def watch(self, interval=1.0, use_inotify=True):
+        """Watch the loaded files and reload the ones which change.
+
+        Changes are detected with inotify on Linux and `os.stat` polling
+        elsewhere, each changed file is applied with `reload_files`.
+
+        :param interval: seconds between checks of the files
+        :param use_inotify: set to False to always poll
+        :return: the started `FileWatcher`, call `.stop()` to stop it
+        """
+        config = self.__core__.config
+        watcher = FileWatcher(
+            paths=lambda: list(config.loaded_files),
+            callback=self.reload_files,
+            interval=interval,
+            use_inotify=use_inotify,
+        )
+        return watcher.start()
+
+    def _load_or_restore(self, kwargs):
+        """`execute_loaders` or restore its result from the snapshot file.
+
+        With `SNAPSHOT_FILE_FOR_DYNACONF` set, a fresh snapshot is restored
+        instead of loading, else the load is recorded and the `Snapshot`
+        is returned to be written once the settings are validated.
+        Loads running python code (`.py` settings, hooks) are not
+        snapshotted, it can read what the fingerprint doesn't cover.
+
+        :param kwargs: the arguments of the instance, part of the key
+        """
+        path = self.get(
+            "SNAPSHOT_FILE_FOR_DYNACONF",
+            default_settings.SNAPSHOT_FILE_FOR_DYNACONF,
+        )
+        core = self.__core__
+        config = core.config
+        if not path or config.post_hooks:
+            self.execute_loaders()
+            return None
+
+        snapshot = Snapshot(path, snapshot_key(kwargs))
+        data = snapshot.read()
+        if data is not None and not (
+            data["loaded_py_modules"] or data["loaded_hooks"]
+        ):
+            self._restore_snapshot(data)
+            return None
+
+        with recording_probes() as probes:
+            self.execute_loaders()
+        if any(loader is not env_loader for loader in self.loaders):
+            return None  # redis, vault, custom loaders must always run
+        if config.loaded_py_modules or config.loaded_hooks:
+            return None  # python code can read anything e.g. os.environ
+
+        prefix = self.get("ENVVAR_PREFIX_FOR_DYNACONF")
+        if prefix is False or prefix == "":
+            prefixes = None  # every variable is loaded
+        else:
+            prefixes = tuple(
+                f"{item.upper()}_"
+                for item in f"DYNACONF,{prefix or ''}".split(",")
+                if item
+            )
+        names = (self.ENV_SWITCHER_FOR_DYNACONF, self.ENVVAR_FOR_DYNACONF)
+        snapshot.record(
+            {
+                "store": plain(core.store),
+                "deleted": set(core.deleted),
+                "layers": core.layers,
+                "loaded_by_loaders": config.loaded_by_loaders,
+                "loaded_envs": config.loaded_envs,
+                "loaded_files": config.loaded_files,
+                "loaded_hooks": config.loaded_hooks,
+                "loaded_py_modules": config.loaded_py_modules,
+            },
+            files=config.loaded_files,
+            probes=probes,
+            environ_filter=(prefixes, names),
+        )
+        return snapshot
+
+    def _restore_snapshot(self, data):
+        """Set the state recorded by `_load_or_restore`."""
+        core = self.__core__
+        config = core.config
+        dynaboxify = self.get("DYNABOXIFY", True)
+        for key, value in data["store"].items():
+            if dynaboxify and isinstance(value, dict):
+                value = DataDict(value, box_settings=self)
+            if isinstance(value, list):
+                value = DataList(value, box_settings=self)
+            core.store[key] = value
+            if _is_key_internal(key):
+                super().__setattr__(key, value)
+        core.deleted.update(data["deleted"])
+        core.layers = data["layers"]
+        config.loaded_by_loaders.clear()
+        config.loaded_by_loaders.update(data["loaded_by_loaders"])
+        config.loaded_envs[:] = data["loaded_envs"]
+        config.loaded_files[:] = data["loaded_files"]
+        config.loaded_hooks.update(data["loaded_hooks"])
+        config.loaded_py_modules[:] = data["loaded_py_modules"]
+        config.fresh_vars = ensure_upperfied_list(self.FRESH_VARS_FOR_DYNACONF)
+        core.refresh_options()
+        core.clear_cache()
+
+    def _clean_for_reload(self):
         config = self.__core__.config
         self.clean()
+        self.__core__.layers.clear()
         config.loaded_hooks.clear()
         for hook in config.post_hooks:
             with suppress(AttributeError, TypeError):
                 hook._called = False
 
-        self.execute_loaders(env, silent)
-
     def execute_loaders(
         self, env=None, silent=None, key=None, filename=None, loaders=None
     ):
@@ -1427,6 +2288,51 @@ class Settings:
         :param filename: optional custom filename to load
         :param loaders: optional list of loader modules
         """
+        env, silent, loaders = self._load_settings_files(
+            env, silent, key, filename, loaders
+        )
+        # non setting_file or py_module loaders
+        for core_loader in loaders:
+            core_loader.load(self, env, silent=silent, key=key)
+
+        self._load_after_loaders(env, silent, key)
+
+    async def aload(
+        self, env=None, silent=None, key=None, filename=None, loaders=None
+    ):
+        """Async counterpart of `execute_loaders`.
+
+        Loaders are still executed one at a time in the same order, loader
+        modules defining an `async def aload(obj, env, silent, key)` are
+        awaited, the others and the settings files are run in a thread so
+        the event loop is never blocked.
+
+        :param env: The environment to load
+        :param silent: If loading errors is silenced
+        :param key: if provided load a single key
+        :param filename: optional custom filename to load
+        :param loaders: optional list of loader modules
+        """
+        # files are looked for from the script of the caller, not from the
+        # frames of the worker threads
+        with pinned_script_dir():
+            env, silent, loaders = await asyncio.to_thread(
+                self._load_settings_files, env, silent, key, filename, loaders
+            )
+            # non setting_file or py_module loaders
+            for core_loader in loaders:
+                if async_load := getattr(core_loader, "aload", None):
+                    await async_load(self, env, silent=silent, key=key)
+                else:
+                    await asyncio.to_thread(
+                        core_loader.load, self, env, silent=silent, key=key
+                    )
+
+            await asyncio.to_thread(self._load_after_loaders, env, silent, key)
+
+    @cached_listings()
+    def _load_settings_files(self, env, silent, key, filename, loaders):
+        """Load defaults and settings files, return the loaders to run."""
         config = self.__core__.config
         if key is None:
             default_loader(self, config.defaults)
@@ -1443,10 +2349,11 @@ class Settings:
             enable_external_loaders(self)
 
             loaders = self.loaders
-        # non setting_file or py_module loaders
-        for core_loader in loaders:
-            core_loader.load(self, env, silent=silent, key=key)
+        return env, silent, loaders
 
+    def _load_after_loaders(self, env, silent, key):
+        """Load includes and run the post hooks."""
+        config = self.__core__.config
         self.load_includes(env, silent=silent, key=key)
 
         # execute hooks
@@ -1473,7 +2380,6 @@ class Settings:
             if last_loader and last_loader == env_loader:
                 last_loader.load(self, env, silent, key)
 
-    @invalidates_cache
     def load_file(
         self,
         path=None,
@@ -1509,17 +2415,21 @@ class Settings:
 
         env = "_envless" if env is False else (env or self.current_env).upper()
 
-        # Using inspect take the filename and line number of the caller
-        # to be used in the source_metadata
-        frame = inspect.currentframe()
-        caller = inspect.getouterframes(frame)[1]
+        # The filename and line number of the caller are used in the
+        # source_metadata, a single frame lookup without source context
+        if self.get("TRACK_LOAD_FILE_CALLER_FOR_DYNACONF", True):
+            caller = sys._getframe(1)
+            filename, lineno = caller.f_code.co_filename, caller.f_lineno
+            loader = f"load_file@{filename}:{lineno}"
+        else:
+            loader = "load_file"
 
         already_loaded = set()
         for _filename in files:
             # load_file() will handle validation later
             with suppress(ValidationError):
                 source_metadata = SourceMetadata(
-                    loader=f"load_file@{caller.filename}:{caller.lineno}",
+                    loader=loader,
                     identifier=_filename,
                     env=env,
                 )
@@ -1546,6 +2456,7 @@ class Settings:
 
             paths = [p for p in sorted(glob(filepath)) if ".local." not in p]
             local_paths = [p for p in sorted(glob(filepath)) if ".local." in p]
+            prefetch_settings_files(self, paths + local_paths)
 
             if (
                 not silent
@@ -1563,7 +2474,7 @@ class Settings:
                 # load_file() will handle validation later
                 with suppress(ValidationError):
                     source_metadata = SourceMetadata(
-                        loader=f"load_file@{caller.filename}:{caller.lineno}",
+                        loader=loader,
                         identifier=path,
                         env=env,
                     )
@@ -1736,6 +2647,39 @@ class Settings:
             new_data["_REGISTERED_HOOKS"] = {}
             return self.__class__(**new_data)
 
+    def freeze(self):
+        """Return a read-only snapshot of the current settings.
+
+        Every Lazy value is evaluated once, dicts become read-only
+        `FrozenDict` and lists become tuples. Reads on the snapshot don't
+        run hooks, casting, fresh vars or loaders.
+        """
+        data = {
+            key: freeze_value(value, self)
+            for key, value in dict.items(self.store)
+        }
+        return FrozenSettings(
+            data, current_env=self.current_env, settings=self
+        )
+
+    def resolve_lazy(self):
+        """Evaluate every Lazy value and store its result in place.
+
+        A value referencing other keys evaluates them first, so errors like
+        circular references or missing keys are raised here instead of on
+        first access. Afterwards reads skip the Lazy evaluation entirely,
+        until a Lazy value is set again.
+        """
+        core = self.__core__
+        store = core.store
+        for key in list(store):
+            value = resolve_value(dict.__getitem__(store, key), self)
+            dict.__setitem__(store, key, value)
+            if _is_key_internal(key):
+                super().__setattr__(key, value)
+        core.clear_cache()
+        core.lazy_resolved = True
+
     @property
     def dynaconf(self):
         """A proxy to access internal methods and attributes
@@ -1771,6 +2715,180 @@ class Settings:
         return False
 
 
+class FrozenSettings:
+    """Read-only snapshot of a Settings object, see `Settings.freeze`.
+
+    Top-level keys are plain instance attributes, so reading them costs a
+    single attribute lookup. The read methods of `Settings` are available,
+    the ones changing the settings raise AttributeError.
+    """
+
+    def __init__(
+        self,
+        data: dict,
+        current_env: str | None = None,
+        settings: Settings | None = None,
+    ):
+        self.__dict__.update(data)
+        self.__dict__["_data"] = FrozenDict(data)
+        self.__dict__["current_env"] = current_env
+        self.__dict__["_settings"] = settings
+        self.__dict__["_nested_separator"] = data.get(
+            "NESTED_SEPARATOR_FOR_DYNACONF"
+        )
+
+    def __getattr__(self, name):
+        """Fallback for non upper case access e.g: `settings.debug`."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __getitem__(self, key):
+        try:
+            return self._data[key]
+        except KeyError:
+            return self._dotted_get(key)
+
+    def __contains__(self, key):
+        return self.get(key, missing) is not missing
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"<FrozenSettings ({self.current_env})>"
+
+    def _dotted_get(self, dotted_key):
+        if not isinstance(dotted_key, str):
+            raise KeyError(dotted_key)
+        nested_sep = self._nested_separator
+        if nested_sep and nested_sep in dotted_key:
+            # turn FOO__bar__ZAZ in `FOO.bar.ZAZ`
+            dotted_key = dotted_key.replace(nested_sep, ".")
+        if "." not in dotted_key:
+            raise KeyError(dotted_key)
+        result = self._data
+        for name in _split_dotted_key(dotted_key):
+            if isinstance(result, dict):
+                result = result[name]
+            elif isinstance(result, tuple) and name.isdigit():
+                try:
+                    result = result[int(name)]
+                except IndexError:
+                    raise KeyError(dotted_key) from None
+            else:
+                raise KeyError(dotted_key)
+        return result
+
+    def get(
+        self,
+        key,
+        default=None,
+        cast=None,
+        fresh=False,
+        dotted_lookup=empty,
+        parent=None,
+        sysenv_fallback=None,
+    ) -> Any:
+        """Get a value by key or dotted path, `default` if not found.
+
+        `fresh`, `parent` and `sysenv_fallback` are read from the settings
+        the snapshot was taken from, the snapshot itself never changes.
+        """
+        if (fresh or parent is not None or sysenv_fallback) and (
+            self._settings is not None
+        ):
+            value = self._settings.get(
+                key,
+                default=default,
+                cast=cast,
+                fresh=fresh,
+                dotted_lookup=dotted_lookup,
+                parent=parent,
+                sysenv_fallback=sysenv_fallback,
+            )
+            return freeze_value(value, self._settings)
+        try:
+            data = self._data[key] if dotted_lookup is False else self[key]
+        except KeyError:
+            data = default
+        if cast and cast in converters:
+            return apply_converter(cast, data, box_settings=self)
+        elif cast is True:
+            return parse_conf_data(data, tomlfy=True, box_settings=self)
+        return data
+
+    def exists(self, key, fresh=False):
+        """Check if key exists"""
+        return self.get(key, default=missing, fresh=fresh) is not missing
+
+    get_fresh = Settings.get_fresh
+    get_environ = Settings.get_environ
+    exists_in_environ = Settings.exists_in_environ
+    as_bool = Settings.as_bool
+    as_int = Settings.as_int
+    as_float = Settings.as_float
+    as_json = Settings.as_json
+
+    @property
+    def environ(self):
+        return os.environ
+
+    @property
+    def validators(self):
+        return self._settings.validators
+
+    def from_env(self, env="", keep=False, **kwargs):
+        """Return a frozen snapshot of the settings for the `env` env."""
+        kwargs["FROZEN_FOR_DYNACONF"] = False
+        return self._settings.from_env(env, keep=keep, **kwargs).freeze()
+
+    def _readonly(self, *args, **kwargs):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    set = update = unset = unset_all = _readonly
+    setenv = using_env = reload = load_file = execute_loaders = _readonly
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def as_dict(self, internal=False):
+        """Return a mutable deep copy of the snapshot as native types."""
+        data = _thaw(self._data)
+        if not internal:
+            for name in UPPER_DEFAULT_SETTINGS:
+                data.pop(name, None)
+        return data
+
+    to_dict = as_dict
+
+
+def _thaw(value):
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in dict.items(value)}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
 """Upper case default settings"""
 UPPER_DEFAULT_SETTINGS = [k for k in dir(default_settings) if k.isupper()]
 
@@ -1796,6 +2914,11 @@ _PUBLIC_PROPERTIES = [
 ]
 
 
+@lru_cache(maxsize=1024)
+def _split_dotted_key(dotted_key: str) -> tuple[str, ...]:
+    return tuple(dotted_key.split("."))
+
+
 @lru_cache
 def _is_key_internal(key: str | int) -> bool:
     return (
@@ -1804,9 +2927,9 @@ def _is_key_internal(key: str | int) -> bool:
 
 
 def _should_use_strict_uppercase(key, obj):
-    return (isinstance(key, str) and key.islower()) and getattr(
-        obj, "LOWERCASE_READ_FOR_DYNACONF", empty
-    ) is False
+    return (
+        isinstance(key, str) and key.islower()
+    ) and obj.__core__.options.lowercase_read is False
 
 
 def _should_load_dotenv(kwargs):
@@ -3,15 +3,32 @@ from __future__ import annotations
 import importlib
 import os
 import sys
+import time
 import warnings
 
+from dynaconf.nodes import DataDict
 from dynaconf.utils import RENAMED_VARS
 from dynaconf.utils import upperfy
 from dynaconf.utils import warn_deprecations
 from dynaconf.utils.files import find_file
 from dynaconf.utils.parse_conf import boolean_fix
 from dynaconf.utils.parse_conf import parse_conf_data
+from dynaconf.utils.watch import stat_signature
 from dynaconf.vendor.dotenv import load_dotenv
+from dynaconf.vendor.dotenv.main import DotEnv
+
+# the caches below are kept when `reload` executes the module again
+_environ_names: set = globals().get("_environ_names", set(RENAMED_VARS))
+"""Names of the env vars read by `get` so far."""
+
+_defaults_cache: dict = globals().get("_defaults_cache", {})
+"""Maps the values of `_environ_names` -> the defaults computed from them."""
+
+_dotenv_cache: dict = globals().get("_dotenv_cache", {})
+"""Maps a .env path -> (stat signature, the env vars it defines)."""
+
+# files changed this recently may change again within the same mtime
+_RACY_WINDOW_NS = 1_000_000_000
 
 
 def try_renamed(key, value, older_key, current_key):
@@ -27,7 +44,9 @@ def try_renamed(key, value, older_key, current_key):
 
 
 def get(key, default=None):
-    value = os.environ.get(upperfy(key))
+    key = upperfy(key)
+    _environ_names.add(key)
+    value = os.environ.get(key)
 
     # compatibility with renamed variables
     for old, new in RENAMED_VARS.items():
@@ -56,19 +75,89 @@ def start_dotenv(obj=None, root_path=None):
         or _find_file(".env", project_root=root_path)
     )
 
-    load_dotenv(
-        dotenv_path,
-        verbose=obj.get("DOTENV_VERBOSE_FOR_DYNACONF", False),
-        override=obj.get("DOTENV_OVERRIDE_FOR_DYNACONF", False),
-    )
+    verbose = obj.get("DOTENV_VERBOSE_FOR_DYNACONF", False)
+    override = obj.get("DOTENV_OVERRIDE_FOR_DYNACONF", False)
+    if dotenv_path:
+        _load_dotenv_file(str(dotenv_path), verbose, override)
+    else:
+        load_dotenv(dotenv_path, verbose=verbose, override=override)
 
     warn_deprecations(os.environ)
 
 
+def _load_dotenv_file(path, verbose, override):
+    """`load_dotenv` unless loading it again would change nothing.
+
+    That is when the file is unchanged and, without override, the env
+    vars it defines still have the values they had after the last load.
+    """
+    path = os.path.abspath(path)
+    signature = stat_signature(path)
+    cached = _dotenv_cache.get(path)
+    if (
+        not override
+        and cached is not None
+        and cached[0] == signature
+        and all(os.environ.get(k) == v for k, v in cached[1].items())
+    ):
+        return
+
+    dotenv = DotEnv(path, verbose=verbose)
+    dotenv.set_as_environment_variables(override=override)
+    if signature and time.time_ns() - signature[0] > _RACY_WINDOW_NS:
+        _dotenv_cache[path] = (
+            signature,
+            {key: os.environ.get(key) for key in dotenv.dict()},
+        )
+
+
+def _copy(value):
+    """Copy the containers of a default, `Settings.set` changes them."""
+    if isinstance(value, dict):
+        data = {key: _copy(item) for key, item in dict.items(value)}
+        return (
+            DataDict(data, box_settings={})
+            if isinstance(value, DataDict)
+            else data
+        )
+    if isinstance(value, list):
+        return [_copy(item) for item in list.__iter__(value)]
+    return value
+
+
 def reload(load_dotenv=None, *args, **kwargs):
+    """Compute the defaults again from the current environment.
+
+    The module is executed again only for a new combination of the env
+    vars it reads, else the defaults computed for it are restored.
+    """
     if load_dotenv:
         start_dotenv(*args, **kwargs)
-    importlib.reload(sys.modules[__name__])
+
+    module = sys.modules[__name__]
+    fingerprint = _environ_fingerprint()
+    defaults = _defaults_cache.get(fingerprint)
+    if defaults is None:
+        importlib.reload(module)
+        defaults = {
+            name: _copy(value)
+            for name, value in vars(module).items()
+            if name.isupper()
+            and not name.startswith("_")
+            and value is not RENAMED_VARS
+        }
+        if fingerprint != _environ_fingerprint():  # read new env vars
+            _defaults_cache.clear()
+            fingerprint = _environ_fingerprint()
+        _defaults_cache[fingerprint] = defaults
+    for name, value in defaults.items():
+        setattr(module, name, _copy(value))
+
+
+def _environ_fingerprint():
+    return tuple(
+        (name, os.environ.get(name)) for name in sorted(_environ_names)
+    )
 
 
 # default proj root
@@ -155,6 +244,10 @@ NESTED_SEPARATOR_FOR_DYNACONF = get("NESTED_SEPARATOR_FOR_DYNACONF", "__")
 # To disable it one can set `INDEX_SEPARATOR_FOR_DYNACONF=None`
 INDEX_SEPARATOR_FOR_DYNACONF = get("INDEX_SEPARATOR_FOR_DYNACONF", None)
 
+# Replace the settings by a read-only snapshot after loading and validation
+# see `Settings.freeze`
+FROZEN_FOR_DYNACONF = get("FROZEN_FOR_DYNACONF", False)
+
 # The env var specifying settings module
 ENVVAR_FOR_DYNACONF = get("ENVVAR_FOR_DYNACONF", "SETTINGS_FILE_FOR_DYNACONF")
 
@@ -223,6 +316,10 @@ SILENT_ERRORS_FOR_DYNACONF = get("SILENT_ERRORS_FOR_DYNACONF", True)
 # always fresh variables
 FRESH_VARS_FOR_DYNACONF = get("FRESH_VARS_FOR_DYNACONF", [])
 
+# seconds a fresh var is served before being reloaded in the background
+# a number for all fresh vars or a {key: seconds} dict, None reloads always
+FRESH_VARS_TTL_FOR_DYNACONF = get("FRESH_VARS_TTL_FOR_DYNACONF", None)
+
 # This was missing for some reason
 # LOAD_DOTENV_FOR_DYNACONF = get("LOAD_DOTENV_FOR_DYNACONF", False)
 DOTENV_PATH_FOR_DYNACONF = get("DOTENV_PATH_FOR_DYNACONF", None)
@@ -237,6 +334,10 @@ INSTANCE_FOR_DYNACONF = get("INSTANCE_FOR_DYNACONF", None)
 # https://msg.pyyaml.org/load
 YAML_LOADER_FOR_DYNACONF = get("YAML_LOADER_FOR_DYNACONF", "safe_load")
 
+# "ruamel" (vendored, pure Python) or "libyaml" to parse with the PyYAML
+# C loaders when available, falling back to ruamel
+YAML_BACKEND_FOR_DYNACONF = get("YAML_BACKEND_FOR_DYNACONF", "ruamel")
+
 # Use commentjson? https://commentjson.readthedocs.io/en/latest/
 COMMENTJSON_ENABLED_FOR_DYNACONF = get(
     "COMMENTJSON_ENABLED_FOR_DYNACONF", False
@@ -254,6 +355,25 @@ INCLUDES_FOR_DYNACONF = get("INCLUDES_FOR_DYNACONF", [])
 # To pre-load extra paths based on envvar
 PRELOAD_FOR_DYNACONF = get("PRELOAD_FOR_DYNACONF", [])
 
+# Parse many settings files concurrently before merging them in order
+# 0 disables it, the executor can be "thread" or "process", threads are the
+# default as they are safe to start anywhere, but with the GIL only processes
+# parse on many cores at once
+PARSE_WORKERS_FOR_DYNACONF = get("PARSE_WORKERS_FOR_DYNACONF", 0)
+PARSE_EXECUTOR_FOR_DYNACONF = get("PARSE_EXECUTOR_FOR_DYNACONF", "thread")
+
+# Path of a file to store the loaded settings and restore them on the next
+# start while the files and env vars they were loaded from are unchanged
+SNAPSHOT_FILE_FOR_DYNACONF = get("SNAPSHOT_FILE_FOR_DYNACONF", None)
+
+# Seconds during which a `@read_file` value is served from its cache
+# without checking the file again, 0 checks (stat) it on every read
+READ_FILE_REVALIDATE_FOR_DYNACONF = get("READ_FILE_REVALIDATE_FOR_DYNACONF", 0)
+
+# "eager" evaluates every lazy value (@format, @jinja, @get...) once after
+# loading and validating, "lazy" evaluates them on every access
+RESOLVE_LAZY_FOR_DYNACONF = get("RESOLVE_LAZY_FOR_DYNACONF", "lazy")
+
 # Files to skip if found on search tree
 SKIP_FILES_FOR_DYNACONF = get("SKIP_FILES_FOR_DYNACONF", [])
 
@@ -271,6 +391,11 @@ VALIDATE_ON_UPDATE_FOR_DYNACONF = get("VALIDATE_ON_UPDATE_FOR_DYNACONF", False)
 # Use system environ as fallback when a setting was not set
 SYSENV_FALLBACK_FOR_DYNACONF = get("SYSENV_FALLBACK_FOR_DYNACONF", False)
 
+# Record the file and line calling `load_file` in the loading history
+TRACK_LOAD_FILE_CALLER_FOR_DYNACONF = get(
+    "TRACK_LOAD_FILE_CALLER_FOR_DYNACONF", True
+)
+
 
 # Backwards compatibility with renamed variables
 for old, new in RENAMED_VARS.items():
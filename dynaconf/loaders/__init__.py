@@ -13,10 +13,13 @@ from dynaconf.loaders import json_loader
 from dynaconf.loaders import py_loader
 from dynaconf.loaders import toml_loader
 from dynaconf.loaders import yaml_loader
+from dynaconf.loaders.base import prefetch_files
 from dynaconf.loaders.base import SourceMetadata
 from dynaconf.nodes import DataDict
 from dynaconf.utils import deduplicate
 from dynaconf.utils import ensure_a_list
+from dynaconf.utils.files import cached_listings
+from dynaconf.utils.files import exists
 from dynaconf.utils.files import get_local_filename
 from dynaconf.utils.files import glob
 from dynaconf.utils.files import has_magic
@@ -246,6 +249,7 @@ def _run_hook_function(
     config.loaded_hooks[identifier][hook_type] = hook_dict
 
 
+@cached_listings()
 def settings_loader(
     obj,
     settings_module=None,
@@ -308,11 +312,13 @@ def settings_loader(
     # add `.local.` to found_files list to search for local files.
     found_files.extend(
         [
-            get_local_filename(item)
+            local_file
             for item in found_files
             if ".local." not in str(item)
+            and exists(local_file := get_local_filename(item))
         ]
     )
+    prefetch_settings_files(obj, found_files)
 
     for mod_file in modules_names + found_files:
         # can be set to multiple files settings.py,settings.yaml,...
@@ -367,6 +373,45 @@ def settings_loader(
                 )
 
 
+def prefetch_settings_files(obj, files):
+    """Parse `files` concurrently when `PARSE_WORKERS_FOR_DYNACONF` is set.
+
+    The files are still loaded and merged one by one in the same order,
+    only the parsing is done ahead, see `base.prefetch_files`.
+    """
+    workers = obj.get("PARSE_WORKERS_FOR_DYNACONF")
+    if not workers or len(files) < 2:
+        return
+    encoding = obj.get("ENCODING_FOR_DYNACONF", "utf-8")
+    # same readers used by each loader, a mismatch only loses the prefetch
+    readers = [
+        (
+            ct.YAML_EXTENSIONS,
+            yaml_loader.get_yaml_reader(obj),
+            {"mode": "r", "encoding": encoding},
+        ),
+        (ct.TOML_EXTENSIONS, toml_loader.tomllib.load, {"mode": "rb"}),
+    ]
+    if not obj.get("COMMENTJSON_ENABLED_FOR_DYNACONF"):
+        readers.append(
+            (
+                ct.JSON_EXTENSIONS,
+                json_loader.json.load,
+                {"mode": "r", "encoding": encoding},
+            )
+        )
+    for extensions, reader, opener_params in readers:
+        selected = [str(f) for f in files if str(f).endswith(extensions)]
+        if len(selected) > 1:
+            prefetch_files(
+                selected,
+                reader,
+                opener_params,
+                workers=workers,
+                executor=obj.get("PARSE_EXECUTOR_FOR_DYNACONF", "thread"),
+            )
+
+
 def load_from_env_named_file(obj, env, key, validate, identifier, mod_file):
     """Load from env named file e.g: development_settings.py"""
     if mod_file.endswith(".py"):
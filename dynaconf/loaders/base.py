@@ -1,13 +1,104 @@
 from __future__ import annotations
 
+import os
+import time
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple
 
 from dynaconf.utils import build_env_list
+from dynaconf.utils import copy_structure
 from dynaconf.utils import ensure_a_list
 from dynaconf.utils import upperfy
 from dynaconf.utils.functional import empty
 
+# Process wide cache of parsed files, validated by `os.stat`
+# {(path, reader, opener_params): ((mtime_ns, size, inode), content)}
+_parsed_files: dict = {}
+
+# files modified less than this many nanoseconds before being read are
+# not cached, as a rewrite within the same timestamp tick would go unseen
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+# Files parsed ahead by `prefetch_files`, used once by `read_file`
+# {(path, reader, opener_params): ((mtime_ns, size, inode), content)}
+_prefetched: dict = {}
+
+
+def clear_parsed_files_cache():
+    """Drops every cached parsed file, forcing them to be read again."""
+    _parsed_files.clear()
+    _prefetched.clear()
+
+
+def _cache_key(source_file, reader, opener_params):
+    return (
+        os.path.abspath(source_file),
+        getattr(reader, "__module__", None),
+        getattr(reader, "__qualname__", repr(reader)),
+        tuple(sorted(opener_params.items())),
+    )
+
+
+def _parse_file(source_file, reader, opener_params):
+    """Parse a single file, runs in the workers of `prefetch_files`."""
+    try:
+        stat = os.stat(source_file)
+        with open(source_file, **opener_params) as open_file:
+            content = reader(open_file)
+        if isinstance(content, Iterator):
+            content = tuple(content)
+    except Exception:  # the loader parses it again and reports the error
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino), content
+
+
+def _is_parsed(source_file, reader, opener_params):
+    """If `_parsed_files` has the content of `source_file` as it is now."""
+    cached = _parsed_files.get(_cache_key(source_file, reader, opener_params))
+    if cached is None:
+        return False
+    try:
+        stat = os.stat(source_file)
+    except OSError:
+        return False
+    return cached[0] == (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def prefetch_files(files, reader, opener_params, workers, executor="thread"):
+    """Parse `files` concurrently ahead of the loaders.
+
+    Loaders still read and merge the files one by one in their order,
+    `read_file` takes the parsed content from here when the reader and the
+    file signature match, otherwise the file is parsed again as usual.
+    Files already in the parsed files cache are not parsed again.
+
+    :param workers: the max number of threads or processes
+    :param executor: "thread" (default) or "process" for CPU bound parsing,
+      which starts new interpreters importing the application again
+    """
+    files = [f for f in files if not _is_parsed(f, reader, opener_params)]
+    if len(files) < 2:
+        return  # not worth a pool, `read_file` parses it
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    with pool:
+        results = pool.map(
+            _parse_file,
+            files,
+            [reader] * len(files),
+            [opener_params] * len(files),
+        )
+        for source_file, result in zip(files, results):
+            if result is not None:
+                key = _cache_key(source_file, reader, opener_params)
+                _prefetched[key] = result
+
 
 class BaseLoader:
     """Base loader for dynaconf source files.
@@ -87,6 +178,36 @@ class BaseLoader:
         else:
             self._load_all_envs(source_data, silent, key)
 
+    def read_file(self, source_file):
+        """Parses `source_file` with `file_reader`.
+
+        The parsed content is kept in a process wide cache and reused while
+        the file `mtime`, `size` and `inode` stay the same, every call gets
+        its own copy of the data.
+        """
+        stat = os.stat(source_file)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cache_key = _cache_key(
+            source_file, self.file_reader, self.opener_params
+        )
+        cached = _parsed_files.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return copy_structure(cached[1])
+
+        prefetched = _prefetched.pop(cache_key, None)
+        if prefetched is not None and prefetched[0] == signature:
+            content = prefetched[1]
+        else:
+            with open(source_file, **self.opener_params) as open_file:
+                content = self.file_reader(open_file)
+            if isinstance(content, Iterator):
+                # multi doc readers return generators
+                content = tuple(content)
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            _parsed_files[cache_key] = (signature, content)
+            content = copy_structure(content)
+        return content
+
     def get_source_data(self, files):
         """Reads each file and returns source data for each file
         {"path/to/file.ext": {"key": "value"}}
@@ -97,11 +218,10 @@ class BaseLoader:
         for source_file in files:
             if source_file.endswith(self.extensions):
                 try:
-                    with open(source_file, **self.opener_params) as open_file:
-                        content = self.file_reader(open_file)
-                        config.loaded_files.append(source_file)
-                        if content:
-                            data[source_file] = content
+                    content = self.read_file(source_file)
+                    config.loaded_files.append(source_file)
+                    if content:
+                        data[source_file] = content
                 except OSError as e:
                     if ".local." not in source_file:
                         warnings.warn(
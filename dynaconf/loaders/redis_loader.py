@@ -3,6 +3,7 @@ from __future__ import annotations
 from dynaconf.loaders.base import SourceMetadata
 from dynaconf.utils import build_env_list
 from dynaconf.utils import upperfy
+from dynaconf.utils.functional import empty
 from dynaconf.utils.parse_conf import parse_conf_data
 from dynaconf.utils.parse_conf import unparse_conf_data
 
@@ -11,10 +12,15 @@ try:
 except ImportError:
     StrictRedis = None
 
+try:
+    from redis.asyncio import StrictRedis as AsyncStrictRedis
+except ImportError:
+    AsyncStrictRedis = None
+
 IDENTIFIER = "redis"
 
 
-def _get_redis_client(obj):
+def _get_redis_client(obj, client_class=empty):
     """Create a Redis client from settings.
 
     If REDIS_URL_FOR_DYNACONF is set, uses StrictRedis.from_url() which
@@ -22,9 +28,12 @@ def _get_redis_client(obj):
     Otherwise falls back to creating a client from REDIS_FOR_DYNACONF kwargs.
 
     :param obj: the settings instance
+    :param client_class: the client to create, default StrictRedis
     :return: StrictRedis client
     """
-    if StrictRedis is None:
+    if client_class is empty:
+        client_class = StrictRedis
+    if client_class is None:
         raise ImportError(
             "redis package is not installed in your environment. "
             "`pip install dynaconf[redis]` or disable the redis loader with "
@@ -33,20 +42,12 @@ def _get_redis_client(obj):
 
     redis_url = obj.get("REDIS_URL_FOR_DYNACONF")
     if redis_url:
-        return StrictRedis.from_url(redis_url)
-    return StrictRedis(**obj.get("REDIS_FOR_DYNACONF"))
+        return client_class.from_url(redis_url)
+    return client_class(**obj.get("REDIS_FOR_DYNACONF"))
 
 
-def load(obj, env=None, silent=True, key=None, validate=False):
-    """Reads and loads in to "settings" a single key or all keys from redis
-
-    :param obj: the settings instance
-    :param env: settings env default='DYNACONF'
-    :param silent: if errors should raise
-    :param key: if defined load a single key, else load all in env
-    :return: None
-    """
-    redis = _get_redis_client(obj)
+def _get_holders(obj, env):
+    """Yield the (env_name, holder) redis hashes to load, in order."""
     prefix = obj.get("ENVVAR_PREFIX_FOR_DYNACONF")
     env_list = build_env_list(obj, env or obj.current_env)
     # prefix is added to env_list to keep backwards compatibility
@@ -58,39 +59,87 @@ def load(obj, env=None, silent=True, key=None, validate=False):
             holder = f"{prefix.upper()}_{env_name.upper()}"
         else:
             holder = env_name.upper()
+        yield env_name, holder.upper()
+
+
+def _set_value(obj, env_name, key, value, validate):
+    if value:
+        parsed_value = parse_conf_data(value, tomlfy=True, box_settings=obj)
+        if parsed_value:
+            obj.set(
+                key,
+                parsed_value,
+                validate=validate,
+                loader_identifier=SourceMetadata(
+                    IDENTIFIER, "unique", env_name
+                ),
+            )
+
+
+def _update_data(obj, env_name, raw_data, validate):
+    data = {
+        key: parse_conf_data(value, tomlfy=True, box_settings=obj)
+        for key, value in raw_data.items()
+    }
+    if data:
+        obj.update(
+            data,
+            loader_identifier=SourceMetadata(IDENTIFIER, "unique", env_name),
+            validate=validate,
+        )
+
 
+def load(obj, env=None, silent=True, key=None, validate=False):
+    """Reads and loads in to "settings" a single key or all keys from redis
+
+    :param obj: the settings instance
+    :param env: settings env default='DYNACONF'
+    :param silent: if errors should raise
+    :param key: if defined load a single key, else load all in env
+    :return: None
+    """
+    redis = _get_redis_client(obj)
+    for env_name, holder in _get_holders(obj, env):
         try:
-            source_metadata = SourceMetadata(IDENTIFIER, "unique", env_name)
             if key:
-                value = redis.hget(holder.upper(), key)
-                if value:
-                    parsed_value = parse_conf_data(
-                        value, tomlfy=True, box_settings=obj
-                    )
-                    if parsed_value:
-                        obj.set(
-                            key,
-                            parsed_value,
-                            validate=validate,
-                            loader_identifier=source_metadata,
-                        )
+                value = redis.hget(holder, key)
+                _set_value(obj, env_name, key, value, validate)
             else:
-                data = {
-                    key: parse_conf_data(value, tomlfy=True, box_settings=obj)
-                    for key, value in redis.hgetall(holder.upper()).items()
-                }
-                if data:
-                    obj.update(
-                        data,
-                        loader_identifier=source_metadata,
-                        validate=validate,
-                    )
+                raw_data = redis.hgetall(holder)
+                _update_data(obj, env_name, raw_data, validate)
         except Exception:
             if silent:
                 return False
             raise
 
 
+async def aload(obj, env=None, silent=True, key=None, validate=False):
+    """Async counterpart of `load` using the redis asyncio client
+
+    :param obj: the settings instance
+    :param env: settings env default='DYNACONF'
+    :param silent: if errors should raise
+    :param key: if defined load a single key, else load all in env
+    :return: None
+    """
+    redis = _get_redis_client(obj, client_class=AsyncStrictRedis)
+    try:
+        for env_name, holder in _get_holders(obj, env):
+            try:
+                if key:
+                    value = await redis.hget(holder, key)
+                    _set_value(obj, env_name, key, value, validate)
+                else:
+                    raw_data = await redis.hgetall(holder)
+                    _update_data(obj, env_name, raw_data, validate)
+            except Exception:
+                if silent:
+                    return False
+                raise
+    finally:
+        await redis.connection_pool.disconnect()
+
+
 def write(obj, data=None, **kwargs):
     """Write a value in to loader source
 
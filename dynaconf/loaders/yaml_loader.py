@@ -11,13 +11,72 @@ from dynaconf.utils import object_merge
 from dynaconf.utils.parse_conf import try_to_encode
 from dynaconf.vendor.ruamel import yaml
 
+try:  # pragma: no cover
+    import yaml as pyyaml
+except ImportError:  # pragma: no cover
+    pyyaml = None
+
 # Add support for Dynaconf Lazy values to YAML dumper
-yaml.SafeDumper.yaml_representers[None] = (
-    lambda self, data: yaml.representer.SafeRepresenter.represent_str(
-        self, try_to_encode(data)
-    )
+yaml.SafeDumper.yaml_representers[None] = lambda self, data: (
+    yaml.representer.SafeRepresenter.represent_str(self, try_to_encode(data))
 )
 
+# `YAML_LOADER_FOR_DYNACONF` names and the matching libyaml loaders
+LIBYAML_LOADERS = {
+    "safe_load": "CSafeLoader",
+    "full_load": "CFullLoader",
+    "unsafe_load": "CUnsafeLoader",
+    "load": "CUnsafeLoader",
+}
+
+
+class LibYAMLReader:
+    """Reads YAML with a PyYAML libyaml (C) loader.
+
+    Named after the `YAML_LOADER_FOR_DYNACONF` function it replaces, e.g.
+    `safe_load_all`, so it is handled the same way as the ruamel readers.
+    """
+
+    def __init__(self, name):
+        self.__name__ = name
+        self.__qualname__ = f"{type(self).__qualname__}.{name}"
+        self.multi_doc = name.endswith("_all")
+        loader_name = LIBYAML_LOADERS[name.removesuffix("_all")]
+        self.loader = getattr(pyyaml, loader_name)
+
+    def __call__(self, stream):
+        if self.multi_doc:
+            return pyyaml.load_all(stream, Loader=self.loader)
+        return pyyaml.load(stream, Loader=self.loader)
+
+    def __reduce__(self):
+        return type(self), (self.__name__,)
+
+    @classmethod
+    def available(cls, name):
+        return (
+            getattr(pyyaml, "__with_libyaml__", False)
+            and name.removesuffix("_all") in LIBYAML_LOADERS
+        )
+
+
+def get_yaml_reader(obj):
+    """The function parsing YAML for `obj`.
+
+    `YAML_BACKEND_FOR_DYNACONF="libyaml"` uses the PyYAML C loaders when
+    PyYAML is installed with libyaml, otherwise the vendored ruamel.
+    """
+    # Resolve the loaders
+    # https://github.com/yaml/pyyaml/wiki/PyYAML-yaml.load(input)-Deprecation
+    # Possible values are:
+    #   `safe_load, full_load, unsafe_load, load, safe_load_all`
+    name = obj.get("YAML_LOADER_FOR_DYNACONF")
+    if obj.get("YAML_BACKEND_FOR_DYNACONF") == "libyaml" and (
+        LibYAMLReader.available(name)
+    ):
+        return LibYAMLReader(name)
+    return getattr(yaml, name, yaml.safe_load)
+
 
 class AllLoader(BaseLoader):
     """YAML Loader to load multi doc files"""
@@ -39,10 +98,9 @@ class AllLoader(BaseLoader):
         for source_file in files:
             if source_file.endswith(self.extensions):
                 try:
-                    with open(source_file, **self.opener_params) as open_file:
-                        content = self.file_reader(open_file)
-                        config.loaded_files.append(source_file)
-                        self._assign_data(data, source_file, content)
+                    content = self.read_file(source_file)
+                    config.loaded_files.append(source_file)
+                    self._assign_data(data, source_file, content)
                 except OSError as e:
                     if ".local." not in source_file:
                         warn(
@@ -75,13 +133,7 @@ def load(
     :param filename: Optional custom filename to load
     :return: None
     """
-    # Resolve the loaders
-    # https://github.com/yaml/pyyaml/wiki/PyYAML-yaml.load(input)-Deprecation
-    # Possible values are:
-    #   `safe_load, full_load, unsafe_load, load, safe_load_all`
-    yaml_reader = getattr(
-        yaml, obj.get("YAML_LOADER_FOR_DYNACONF"), yaml.safe_load
-    )
+    yaml_reader = get_yaml_reader(obj)
     if yaml_reader.__name__ == "unsafe_load":  # pragma: no cover
         warn(
             "yaml.unsafe_load is deprecated."
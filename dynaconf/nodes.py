@@ -17,7 +17,11 @@ import contextvars
 import copy
 import inspect
 import warnings
+from contextlib import contextmanager
+from contextlib import suppress
 from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Union
@@ -44,6 +48,8 @@ class NodeMetadata:
 
     core: Optional[DynaconfCore] = None
     data_env: str = "default"
+    # lowercase form -> actual keys, in insertion order (see `find_casing`)
+    casing: dict = field(default_factory=dict)
 
 
 class DataDict(dict):
@@ -51,14 +57,49 @@ class DataDict(dict):
         core = kwargs.pop("box_settings", kwargs.pop("core", None))
         super().__init__(*args, **kwargs)
         self.__meta__ = NodeMetadata(core=core)
+        for key in self:
+            index_casing(self, key)
         convert_containers(self, self.items(), core)
 
     def update(self, data):
+        if not hasattr(data, "keys"):
+            data = dict(data)
         super().update(ensure_containers(data, self.__meta__.core))
+        for key in data:
+            index_casing(self, key)
+        node_changed(self)
 
-    def setdefault(self, k, v):
+    def setdefault(self, k, v=None):
+        index_casing(self, k)
+        node_changed(self)
         return super().setdefault(k, ensure_containers(v, self.__meta__.core))
 
+    def pop(self, k, *default):
+        result = super().pop(k, *default)
+        unindex_casing(self, k)
+        node_changed(self)
+        return result
+
+    def popitem(self):
+        k, v = super().popitem()
+        unindex_casing(self, k)
+        node_changed(self)
+        return k, v
+
+    def clear(self):
+        super().clear()
+        self.__meta__.casing.clear()
+        node_changed(self)
+
+    def __or__(self, data: Any) -> dict:
+        # defined only to keep a signature compatible with `__ior__`
+        return super().__or__(data)
+
+    def __ior__(self, data: Any) -> DataDict:
+        # `dict.__ior__` doesn't call `update`, which indexes the casing
+        self.update(data)
+        return self
+
     def copy(self, bypass_eval=False):
         if not bypass_eval:
             return self.__class__(
@@ -75,20 +116,14 @@ class DataDict(dict):
             try:
                 result = super().__getitem__(item)
             except KeyError:
-                pass
-                n_item = (
-                    ut.find_the_correct_casing(item, tuple(self.keys()))
-                    or item
-                )
+                n_item = find_casing(self, item) or item
                 result = super().get(n_item, empty)
                 result = result if result is not empty else default
             return recursively_evaluate_lazy_format(result, self.__meta__.core)
         try:
             return super().__getitem__(item)
         except (AttributeError, KeyError):
-            n_item = (
-                ut.find_the_correct_casing(item, tuple(self.keys())) or item
-            )
+            n_item = find_casing(self, item) or item
             return super().__getitem__(n_item)
 
     def __copy__(self):
@@ -98,9 +133,7 @@ class DataDict(dict):
         try:
             result = super().__getitem__(item)
         except (AttributeError, KeyError):
-            n_item = (
-                ut.find_the_correct_casing(item, tuple(self.keys())) or item
-            )
+            n_item = find_casing(self, item) or item
             result = super().__getitem__(n_item)
         return recursively_evaluate_lazy_format(result, self.__meta__.core)
 
@@ -120,6 +153,8 @@ class DataDict(dict):
     def __setitem__(self, k, v):
         result = ensure_containers(v, self.__meta__.core)
         super().__setitem__(k, result)
+        index_casing(self, k)
+        node_changed(self)
 
     def __setattr__(self, k, v):
         # NOTE: We shouldnt use setattr to store items. If an item was assigned with setatttr
@@ -132,8 +167,10 @@ class DataDict(dict):
         self[k] = v
 
     def __delitem__(self, k):
-        resolved = ut.find_the_correct_casing(k, tuple(self.keys())) or k
+        resolved = find_casing(self, k) or k
         super().__delitem__(resolved)
+        unindex_casing(self, resolved)
+        node_changed(self)
 
     def __delattr__(self, name):
         self.__delitem__(name)
@@ -142,6 +179,10 @@ class DataDict(dict):
         # NOTE: debatable choice: same representation of dict
         return f"{dict(self)}"
 
+    def __reduce__(self):
+        """Pickle the raw items, the core is not part of the data."""
+        return self.__class__, (dict(super().items()),)
+
     def __iter__(self):
         # WARNING: this has some side-effect that triggerse lazy evaluation
         # when calling dict(DataDict). If absence, it won't trigger, which
@@ -149,7 +190,7 @@ class DataDict(dict):
         yield from self.keys()
 
     def __contains__(self, key):
-        resolved = ut.find_the_correct_casing(key, tuple(self.keys())) or key
+        resolved = find_casing(self, key) or key
         return super().__contains__(resolved)
 
     # Box compatibility. Remove in 4.0
@@ -409,12 +450,40 @@ class DataList(list):
 
     def append(self, v):
         super().append(ensure_containers(v, self.__meta__.core))
+        node_changed(self)
 
     def insert(self, i, v):
         super().insert(i, ensure_containers(v, self.__meta__.core))
+        node_changed(self)
 
     def extend(self, data):
         super().extend(ensure_containers(data, self.__meta__.core))
+        node_changed(self)
+
+    def pop(self, *index):
+        result = super().pop(*index)
+        node_changed(self)
+        return result
+
+    def remove(self, v):
+        super().remove(v)
+        node_changed(self)
+
+    def clear(self):
+        super().clear()
+        node_changed(self)
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        node_changed(self)
+
+    def reverse(self):
+        super().reverse()
+        node_changed(self)
+
+    def __delitem__(self, k):
+        super().__delitem__(k)
+        node_changed(self)
 
     def __getitem__(self, index):
         result = super().__getitem__(index)
@@ -422,17 +491,24 @@ class DataList(list):
 
     def __setitem__(self, k, v):
         super().__setitem__(k, ensure_containers(v, self.__meta__.core))
+        node_changed(self)
 
     def __add__(self, v):
         super().__add__(ensure_containers(v, self.__meta__.core))
 
     def __iadd__(self, v):
-        return super().__iadd__(ensure_containers(v, self.__meta__.core))
+        result = super().__iadd__(ensure_containers(v, self.__meta__.core))
+        node_changed(self)
+        return result
 
     def __repr__(self):
         # NOTE: debatable choice: same representation of list
         return f"{list(self)!r}"
 
+    def __reduce__(self):
+        """Pickle the raw items, the core is not part of the data."""
+        return self.__class__, (list(super().__iter__()),)
+
     # Box compatibility. Remove in 4.0
 
     def __copy__(self):  # pragma: nocover
@@ -716,6 +792,72 @@ class DataList(list):
         )
 
 
+class FrozenDict(dict):
+    """A read-only dict with attribute access, see `freeze_value`.
+
+    Exact keys are plain dict hits, other casings are found through an
+    index of the lowercase keys, built on the first miss.
+    """
+
+    __slots__ = ("_casing",)
+
+    def __missing__(self, key):
+        if isinstance(key, str):
+            try:
+                # not `self._casing`, `__getattr__` would look for a key
+                casing = object.__getattribute__(self, "_casing")
+            except AttributeError:
+                casing = {}
+                for correct_key in self:
+                    if isinstance(correct_key, str):
+                        casing.setdefault(correct_key.lower(), correct_key)
+                object.__setattr__(self, "_casing", casing)
+            correct_key = casing.get(key.lower())
+            if correct_key is not None:
+                return dict.__getitem__(self, correct_key)
+        raise KeyError(key)
+
+    def __getattr__(self, item):
+        try:
+            return self[item]
+        except KeyError:
+            raise AttributeError(item) from None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
 ################
 ## NODE UTILS ##
 ################
@@ -739,15 +881,175 @@ def get_core(node, raises=True) -> DynaconfCore:
     return dynaconf_core
 
 
+def _casing_forms(key: str) -> set[str]:
+    """The lowercase forms under which `key` can be found.
+
+    Mirrors the comparisons made by `utils.find_the_correct_casing`.
+    """
+    lower = key.lower()
+    return {lower, lower.replace(" ", "_")}
+
+
+def index_casing(node: DataDict, key):
+    """Register `key` in the case-insensitive index of `node`."""
+    if not isinstance(key, str):
+        return
+    casing = node.__meta__.casing
+    for form in _casing_forms(key):
+        keys = casing.setdefault(form, [])
+        if key not in keys:
+            keys.append(key)
+
+
+def unindex_casing(node: DataDict, key):
+    """Remove `key` from the case-insensitive index of `node`."""
+    if not isinstance(key, str) or dict.__contains__(node, key):
+        return
+    casing = node.__meta__.casing
+    for form in _casing_forms(key):
+        keys = casing.get(form)
+        if keys and key in keys:
+            keys.remove(key)
+            if not keys:
+                del casing[form]
+
+
+def find_casing(data: dict, key):
+    """Given a key, find its proper casing in `data` or return None.
+
+    DataDict nodes answer from their maintained index in O(1), other
+    mappings fallback to a scan of their keys.
+    """
+    if not isinstance(key, str) or dict.__contains__(data, key):
+        return key
+    # `__meta__` may not be there yet while a node is being copied
+    meta = (
+        data.__dict__.get("__meta__") if isinstance(data, DataDict) else None
+    )
+    if meta is not None:
+        keys = meta.casing.get(key.lower())
+        return keys[0] if keys else None
+    return ut.find_the_correct_casing(key, tuple(data.keys()))
+
+
 def convert_containers(data: dict | list | DataNode, iter, core):
+    # a node being built can't have been read, skip `node_changed`
     for key, value in iter:
         if value.__class__ is dict:
-            data[key] = DataDict(value, core=core)
-        if value.__class__ is list:
-            data[key] = DataList(value, core=core)
+            value = DataDict(value, core=core)
+        elif value.__class__ is list:
+            value = DataList(value, core=core)
+        else:
+            continue
+        if isinstance(data, dict):
+            dict.__setitem__(data, key, value)
+        else:
+            list.__setitem__(data, key, value)
+
+
+def node_changed(node):
+    """Tell the settings owning `node` that it was changed in place.
+
+    The values cached from the store (e.g, dotted lookups, evaluated Lazy
+    values) may have been computed from the node, they are dropped.
+    """
+    core = getattr(node.__meta__.core, "__core__", None)
+    if core is not None:
+        core.store_changed(node)
 
 
 _eval_stack_ctx = contextvars.ContextVar("_eval_stack_ctx", default=None)
+_dependencies_ctx = contextvars.ContextVar("_dependencies_ctx", default=None)
+
+VOLATILE = object()
+"""Recorded when a Lazy evaluation read something that can't be tracked."""
+
+
+def record_dependency(key, volatile=False):
+    """Record that the Lazy value being evaluated has read the `key` setting.
+
+    When `volatile` is True the value read can change without the key being
+    set (e.g, fresh vars, sysenv fallback) so the result must not be cached.
+    """
+    dependencies = _dependencies_ctx.get()
+    if dependencies is not None:
+        dependencies.add(VOLATILE if volatile else key)
+
+
+def record_dependencies(keys):
+    """Record each of `keys` as `record_dependency` does, at once."""
+    dependencies = _dependencies_ctx.get()
+    if dependencies is not None:
+        dependencies.update(keys)
+
+
+@contextmanager
+def tracking_dependencies():
+    """Collect the keys read within the block into the yielded set.
+
+    The collected keys are also recorded on the enclosing tracker, if any.
+    """
+    parent_dependencies = _dependencies_ctx.get()
+    dependencies: set = set()
+    token = _dependencies_ctx.set(dependencies)
+    try:
+        yield dependencies
+    finally:
+        _dependencies_ctx.reset(token)
+    if parent_dependencies is not None:
+        parent_dependencies.update(dependencies)
+
+
+def _evaluate_lazy(value, settings):
+    """Evaluate a Lazy value, memoizing the result on the settings core.
+
+    The top-level keys read during evaluation are recorded as dependencies,
+    so the cached result is only invalidated when one of them changes.
+    """
+    core = getattr(settings, "__core__", None)
+    memoize = value.cacheable and hasattr(core, "set_lazy_cached")
+    parent_dependencies = _dependencies_ctx.get()
+
+    if memoize:
+        with suppress(KeyError):
+            result, dependencies = core.get_lazy_cached(value)
+            if parent_dependencies is not None:
+                parent_dependencies.update(dependencies)
+            return result
+
+    # Use context-local storage for the evaluation stack
+    eval_stack = _eval_stack_ctx.get()
+    if eval_stack is None:
+        eval_stack = []
+        _eval_stack_ctx.set(eval_stack)
+
+    # Check for circular reference
+    value_id = id(value)
+    if value_id in eval_stack:
+        raise __import__("dynaconf.utils.parse_conf").DynaconfFormatError(
+            "Circular reference detected in lazy formatting. "
+            "A value is referencing itself directly or indirectly."
+        )
+
+    generation = getattr(core, "generation", None)
+    dependencies: set = set() if memoize else {VOLATILE}
+    token = _dependencies_ctx.set(dependencies)
+    # Add to stack before evaluation
+    eval_stack.append(value_id)
+    try:
+        result = value(settings)
+    finally:
+        # Remove from stack after evaluation
+        eval_stack.pop()
+        _dependencies_ctx.reset(token)
+
+    if parent_dependencies is not None:
+        parent_dependencies.update(dependencies)
+    if VOLATILE not in dependencies:
+        core.set_lazy_cached(
+            value, result, frozenset(dependencies), generation
+        )
+    return result
 
 
 def recursively_evaluate_lazy_format(value, settings):
@@ -760,29 +1062,15 @@ def recursively_evaluate_lazy_format(value, settings):
 
     Uses contextvars for context-local storage, ensuring proper isolation
     in both threaded and async (asyncio) environments.
-    """
-    if value.__class__.__name__ == "Lazy":
-        # Use context-local storage for the evaluation stack
-        eval_stack = _eval_stack_ctx.get()
-        if eval_stack is None:
-            eval_stack = []
-            _eval_stack_ctx.set(eval_stack)
-
-        # Check for circular reference
-        value_id = id(value)
-        if value_id in eval_stack:
-            raise __import__("dynaconf.utils.parse_conf").DynaconfFormatError(
-                "Circular reference detected in lazy formatting. "
-                "A value is referencing itself directly or indirectly."
-            )
 
-        # Add to stack before evaluation
-        eval_stack.append(value_id)
-        try:
-            value = value(settings)
-        finally:
-            # Remove from stack after evaluation
-            eval_stack.pop()
+    Once `resolve_lazy` has evaluated every Lazy value only the lists are
+    copied, as they are when Lazy values are evaluated.
+    """
+    resolved = getattr(
+        getattr(settings, "__core__", None), "lazy_resolved", False
+    )
+    if not resolved and value.__class__.__name__ == "Lazy":
+        value = _evaluate_lazy(value, settings)
 
     if isinstance(value, list):
         # This must be the right way of doing it, but breaks validators
@@ -800,6 +1088,64 @@ def recursively_evaluate_lazy_format(value, settings):
     return value
 
 
+def freeze_value(value, settings):
+    """Evaluate Lazy values in `value` and turn it into read-only types.
+
+    Dicts become FrozenDict and lists/tuples become tuples.
+    """
+    if value.__class__.__name__ == "Lazy":
+        value = _evaluate_lazy(value, settings)
+    if isinstance(value, dict):
+        return FrozenDict(
+            (key, freeze_value(item, settings))
+            for key, item in dict.items(value)
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item, settings) for item in value)
+    return value
+
+
+def resolve_value(value, settings):
+    """Evaluate Lazy values in `value` and return it without any Lazy left.
+
+    Dicts and lists are copied, not changed in place, as their nodes may be
+    shared with e.g. `config.defaults` or the results of Lazy values.
+    """
+    if value.__class__.__name__ == "Lazy":
+        value = _evaluate_lazy(value, settings)
+    if isinstance(value, dict):
+        value = value.copy()
+        for key, item in dict.items(value):
+            dict.__setitem__(value, key, resolve_value(item, settings))
+    elif isinstance(value, list):
+        value = value.copy()
+        for index, item in enumerate(list.__iter__(value)):
+            list.__setitem__(value, index, resolve_value(item, settings))
+    return value
+
+
+def has_lazy(value):
+    """Whether a Lazy value is found in `value` or its dicts and lists."""
+    if value.__class__.__name__ == "Lazy":
+        return True
+    if isinstance(value, dict):
+        return any(has_lazy(item) for item in dict.values(value))
+    if isinstance(value, list):
+        return any(has_lazy(item) for item in list.__iter__(value))
+    return False
+
+
+def holds_node(value, node):
+    """Whether `node` is `value` itself or one of its dicts and lists."""
+    if value is node:
+        return True
+    if isinstance(value, dict):
+        return any(holds_node(item, node) for item in dict.values(value))
+    if isinstance(value, list):
+        return any(holds_node(item, node) for item in list.__iter__(value))
+    return False
+
+
 def ensure_containers(data, core):
     # NOTE: this is to ensure that the nodes nested dict and lists are always
     # converted to DataDict and DataList. However, that change is not compatible
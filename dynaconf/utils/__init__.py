@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 import warnings
@@ -101,10 +102,10 @@ def object_merge(
         # data coming from source, in `new` can be mix case: KEY4|key4|Key4
         # data existing on `old` object has the correct case: key4|KEY4|Key4
         # So we need to ensure that new keys matches the existing keys
+        from dynaconf.nodes import find_casing  # avoid circular import
+
         for new_key in tuple(new.keys()):
-            correct_case_key = find_the_correct_casing(
-                new_key, tuple(old.keys())
-            )
+            correct_case_key = find_casing(old, new_key)
             if correct_case_key:
                 new[correct_case_key] = new.pop(new_key)
 
@@ -146,6 +147,26 @@ def object_merge(
     return new
 
 
+def copy_structure(data: Any) -> Any:
+    """Copy the dicts, lists, tuples and meta values of `data` sharing the
+    scalars.
+
+    Used to keep raw data which `parse_conf_data` and `object_merge` would
+    otherwise change in place.
+    """
+    if isinstance(data, dict):
+        return {k: copy_structure(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [copy_structure(v) for v in data]
+    if isinstance(data, tuple) and not isnamedtupleinstance(data):
+        return tuple(copy_structure(v) for v in data)
+    if getattr(data, "_meta_value", False):  # @merge, @insert...
+        meta_value = copy.copy(data)
+        meta_value.value = copy_structure(data.value)
+        return meta_value
+    return data
+
+
 def recursive_get(
     obj: DataDict | dict[str, int] | dict[str, str | int],
     names: list[str] | None,
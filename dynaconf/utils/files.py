@@ -1,13 +1,143 @@
 from __future__ import annotations
 
-import inspect
+import contextvars
 import os
 import re
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from glob import glob as python_glob
 
 from dynaconf.utils import deduplicate
 
+_listings: contextvars.ContextVar = contextvars.ContextVar(
+    "_listings", default=None
+)
+"""Maps dirname -> names in it, while `cached_listings` is active."""
+
+_probes: contextvars.ContextVar = contextvars.ContextVar(
+    "_probes", default=None
+)
+"""Maps probe -> answer of `exists` and `glob`, see `recording_probes`."""
+
+_pinned_script_dir: contextvars.ContextVar = contextvars.ContextVar(
+    "_pinned_script_dir", default=None
+)
+"""The `_script_dir` of the caller while `pinned_script_dir` is active."""
+
+if sys.platform in ("darwin", "win32"):  # pragma: no cover
+    _fold = str.casefold  # case insensitive filesystems by default
+else:
+
+    def _fold(name):
+        return name
+
+
+@contextmanager
+def cached_listings():
+    """Within the block `exists` reads each directory once.
+
+    Used around settings files discovery, where the same directories are
+    checked for many candidate names, most of which do not exist.
+    """
+    if _listings.get() is not None:  # already in a load cycle
+        yield
+        return
+    token = _listings.set({})
+    try:
+        yield
+    finally:
+        _listings.reset(token)
+
+
+@contextmanager
+def pinned_script_dir():
+    """Within the block `_script_dir` answers what it answers here.
+
+    Threads started by `asyncio.to_thread` run in a copy of the context, so
+    the files they look for are searched from the script of the caller and
+    not from the outermost frame of the worker thread.
+    """
+    if _pinned_script_dir.get() is not None:
+        yield
+        return
+    token = _pinned_script_dir.set(_script_dir())
+    try:
+        yield
+    finally:
+        _pinned_script_dir.reset(token)
+
+
+@contextmanager
+def recording_probes():
+    """Within the block the answers of `exists` and `glob` are recorded.
+
+    Yields a dict of `("exists", path) -> bool` and
+    `("glob", pathname, root_dir) -> paths`, the files which were looked
+    for and not found are part of what a load depends on, see
+    `probes_match`.
+    """
+    probes: dict = {}
+    token = _probes.set(probes)
+    try:
+        yield probes
+    finally:
+        _probes.reset(token)
+
+
+def probes_match(probes):
+    """True if `exists` and `glob` still answer as recorded in `probes`."""
+    for probe, answer in probes.items():
+        if probe[0] == "exists":
+            if os.path.exists(probe[1]) != answer:
+                return False
+        elif tuple(glob(probe[1], root_dir=probe[2])) != answer:
+            return False
+    return True
+
+
+def _listing(dirname):
+    """{name: is_symlink} of the entries of `dirname`, or None when the
+    listing is not cached or the directory can't be listed."""
+    listings = _listings.get()
+    if listings is None:
+        return None
+    if dirname not in listings:
+        names: dict | None = {}
+        try:
+            with os.scandir(dirname or os.curdir) as entries:
+                for entry in entries:
+                    names[_fold(entry.name)] = entry.is_symlink()
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        except OSError:  # e.g. not readable, ask the filesystem each time
+            names = None
+        listings[dirname] = names
+    return listings[dirname]
+
+
+def exists(path):
+    """`os.path.exists`, answered from the directory listing when called
+    within `cached_listings`."""
+    answer = _exists(path)
+    probes = _probes.get()
+    if probes is not None:
+        probes["exists", str(path)] = answer
+    return answer
+
+
+def _exists(path):
+    dirname, name = os.path.split(str(path))
+    if name in ("", os.curdir, os.pardir):
+        return os.path.exists(path)
+    listing = _listing(dirname)
+    if listing is None:
+        return os.path.exists(path)
+    is_symlink = listing.get(_fold(name))
+    if is_symlink:  # the target may not exist
+        return os.path.exists(path)
+    return is_symlink is not None
+
 
 def _walk_to_root(path, break_at=None):
     """
@@ -35,6 +165,50 @@ def _walk_to_root(path, break_at=None):
 SEARCHTREE = []
 
 
+@lru_cache(maxsize=1)
+def _main_script_dir():
+    """Directory of `__main__.__file__`, None when it has no file."""
+    main_file = getattr(sys.modules.get("__main__"), "__file__", None)
+    if not main_file:
+        return None
+    return os.path.dirname(os.path.abspath(main_file))
+
+
+def _script_dir():
+    """Directory of the invoked script, the file of `__main__`, or the one
+    pinned by `pinned_script_dir`.
+
+    Without one (e.g, the REPL or `python -c`) it is the file of the
+    outermost frame of the current thread, found walking the `f_back`
+    chain, `inspect.stack()` would also build a `FrameInfo` with source
+    context for every frame.
+    """
+    script_dir = _pinned_script_dir.get() or _main_script_dir()
+    if script_dir is not None:
+        return script_dir
+    frame = sys._getframe()
+    while frame.f_back is not None:
+        frame = frame.f_back
+    return os.path.dirname(os.path.abspath(frame.f_code.co_filename))
+
+
+@lru_cache(maxsize=128)
+def _search_tree(project_root, work_dir, script_dir):
+    """Deduplicated directories to look for files, see `find_file`."""
+    search_tree = []
+    if project_root is not None:
+        search_tree.extend(_walk_to_root(project_root, break_at=work_dir))
+
+    # Path to invoked script and recursively to root with its ./config dirs
+    search_tree.extend(_walk_to_root(script_dir))
+
+    # Path to where Python interpreter was invoked and recursively to root
+    search_tree.extend(_walk_to_root(work_dir))
+
+    # Don't look the same place twice
+    return tuple(deduplicate(search_tree))
+
+
 def find_file(filename=".env", project_root=None, skip_files=None, **kwargs):
     """Search in increasingly higher folders for the given file
     Returns path to the file if found, or an empty string otherwise.
@@ -52,28 +226,19 @@ def find_file(filename=".env", project_root=None, skip_files=None, **kwargs):
     # if the absolute path does not exist, return empty string so
     # that it can be joined and avoid IoError
     if os.path.isabs(filename):
-        return filename if os.path.exists(filename) else ""
+        return filename if exists(filename) else ""
 
-    search_tree = []
     try:
         work_dir = os.getcwd()
     except FileNotFoundError:  # pragma: no cover
         return ""
     skip_files = skip_files or []
 
-    if project_root is not None:
-        search_tree.extend(_walk_to_root(project_root, break_at=work_dir))
-
-    script_dir = os.path.dirname(os.path.abspath(inspect.stack()[-1].filename))
-
-    # Path to invoked script and recursively to root with its ./config dirs
-    search_tree.extend(_walk_to_root(script_dir))
-
-    # Path to where Python interpreter was invoked and recursively to root
-    search_tree.extend(_walk_to_root(work_dir))
-
-    # Don't look the same place twice
-    search_tree = deduplicate(search_tree)
+    search_tree = _search_tree(
+        None if project_root is None else str(project_root),
+        work_dir,
+        _script_dir(),
+    )
 
     global SEARCHTREE
     SEARCHTREE[:] = search_tree
@@ -82,7 +247,7 @@ def find_file(filename=".env", project_root=None, skip_files=None, **kwargs):
         check_path = os.path.join(dirname, filename)
         if check_path in skip_files:
             continue
-        if os.path.exists(check_path):
+        if exists(check_path):
             return check_path  # First found will return
 
     # return empty string if not found so it can still be joined in os.path
@@ -143,4 +308,8 @@ def glob(
         glob_args["dir_fd"] = dir_fd
     if sys.version_info >= (3, 11):
         glob_args["include_hidden"] = include_hidden
-    return python_glob(pathname, **glob_args)
+    paths = python_glob(pathname, **glob_args)
+    probes = _probes.get()
+    if probes is not None:
+        probes["glob", pathname, root_dir] = tuple(paths)
+    return paths
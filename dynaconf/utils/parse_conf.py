@@ -3,9 +3,12 @@ from __future__ import annotations
 import json
 import os
 import re
+import stat
 import string
+import time
 import warnings
 from contextlib import suppress
+from functools import lru_cache
 from functools import wraps
 
 from dynaconf.nodes import DataDict
@@ -27,6 +30,12 @@ try:
 except ImportError:  # pragma: no cover
     jinja_env = None
 
+TEMPLATE_CACHE_SIZE = 1024
+"""How many compiled `@jinja` and parsed `@format` templates are kept."""
+
+# files changed this recently may change again within the same mtime
+_RACY_WINDOW_NS = 1_000_000_000
+
 true_values = ("t", "true", "enabled", "1", "on", "yes")
 false_values = ("f", "false", "disabled", "0", "off", "no", "")
 
@@ -103,6 +112,10 @@ class MetaValue:
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value}) on {id(self)}"
 
+    def __getstate__(self):
+        """Pickle without the settings, only used to parse the value."""
+        return {**self.__dict__, "box_settings": None}
+
     def unwrap(self):
         return self.value
 
@@ -294,13 +307,19 @@ class BaseFormatter:
         return str(self.token)
 
 
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile_jinja(value: str):
+    """The compiled template of `value`, rendering only runs the code."""
+    return jinja_env.from_string(value)
+
+
 def _jinja_formatter(value: str, **context) -> str:
     if jinja_env is None:  # pragma: no cover
         raise ImportError(
             "jinja2 must be installed to enable '@jinja' settings in dynaconf"
         )
     try:
-        return jinja_env.from_string(value).render(**context)
+        return _compile_jinja(value).render(**context)
     except jinja2.exceptions.SecurityError:
         warnings.warn(f"Unsafe access attempt to: {value}")
         return ""
@@ -410,23 +429,11 @@ def _read_file_formatter(value, **context):
     if not path:
         raise DynaconfFormatError("Error parsing: empty path")
 
-    # Check if path exists and is a file
-    if os.path.exists(path):
-        if not os.path.isfile(path):
-            raise DynaconfFormatError(f"{path} is not a file")
-
-        try:
-            with open(path, encoding="utf-8") as file:
-                return file.read()
-        except PermissionError:
-            raise DynaconfFormatError(f"Permission denied reading {path}")
-        except UnicodeDecodeError:
-            raise DynaconfFormatError(
-                f"{path} is not a UTF-8 text file (binary files not supported)"
-            )
-        except OSError as e:
-            # Covers other I/O errors (file locked, disk full, etc.)
-            raise DynaconfFormatError(f"Error reading {path}: {e}")
+    this = context.get("this") or {}
+    revalidate = this.get("READ_FILE_REVALIDATE_FOR_DYNACONF", 0)
+    content = _read_cached_file(path, revalidate)
+    if content is not None:
+        return content
     elif default is not None:
         return default
     else:
@@ -435,7 +442,70 @@ def _read_file_formatter(value, **context):
         )
 
 
+_read_file_cache: dict[str, tuple] = {}
+"""abspath -> (stat signature, monotonic time of the last stat, content)"""
+
+
+def _read_cached_file(path, revalidate=0):
+    """The content of `path` or None if it doesn't exist.
+
+    The content is kept while the (mtime_ns, size, inode) of the file is
+    unchanged, a file is only read again after it is replaced or written.
+
+    :param revalidate: seconds during which the cached content is returned
+        without a `os.stat`, 0 checks the file on every call.
+    """
+    key = os.path.abspath(path)
+    cached = _read_file_cache.get(key)
+    now = time.monotonic()
+    if cached and revalidate and now - cached[1] < float(revalidate):
+        return cached[2]
+
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        _read_file_cache.pop(key, None)
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        _read_file_cache.pop(key, None)
+        raise DynaconfFormatError(f"{path} is not a file")
+
+    signature = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+    if cached and cached[0] == signature:
+        _read_file_cache[key] = (signature, now, cached[2])
+        return cached[2]
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            content = file.read()
+    except PermissionError:
+        raise DynaconfFormatError(f"Permission denied reading {path}")
+    except UnicodeDecodeError:
+        raise DynaconfFormatError(
+            f"{path} is not a UTF-8 text file (binary files not supported)"
+        )
+    except OSError as e:
+        # Covers other I/O errors (file locked, disk full, etc.)
+        raise DynaconfFormatError(f"Error reading {path}: {e}")
+
+    # a file written in the same mtime tick could be missed, don't trust it
+    if time.time_ns() - file_stat.st_mtime_ns > _RACY_WINDOW_NS:
+        _read_file_cache[key] = (signature, now, content)
+    else:
+        _read_file_cache.pop(key, None)
+    return content
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse_format(format_string: str) -> tuple:
+    """The `(literal_text, field_name, format_spec, conversion)` parts."""
+    return tuple(string.Formatter().parse(format_string))
+
+
 class SafeFormatter(string.Formatter):
+    def parse(self, format_string):
+        return _parse_format(format_string)
+
     def get_field(self, field_name, args, context):
         self._validate_key_exists(field_name, context)
         return super().get_field(field_name, args, context)
@@ -457,8 +527,11 @@ class SafeFormatter(string.Formatter):
             raise AttributeError(key)
 
 
+_safe_formatter = SafeFormatter()
+
+
 def _format_formatter(input: str, **context) -> str:
-    return SafeFormatter().format(input, **context)
+    return _safe_formatter.format(input, **context)
 
 
 class Formatters:
@@ -470,6 +543,9 @@ class Formatters:
     read_file_formatter = BaseFormatter(_read_file_formatter, "read_file")
 
 
+_CACHEABLE_FORMATTERS = ("format", "jinja", "get")
+
+
 class Lazy:
     """Holds data to format lazily."""
 
@@ -488,6 +564,18 @@ class Lazy:
         else:
             self.formatter = BaseFormatter(formatter, "lambda")
 
+    @property
+    def cacheable(self):
+        """If the result only depends on settings keys and can be memoized.
+
+        Values reading the environment, files or custom formatters are
+        always evaluated again.
+        """
+        return (
+            self.formatter.token in _CACHEABLE_FORMATTERS
+            and "env" not in str(self.value)
+        )
+
     @property
     def context(self):
         """Builds a context for formatting."""
@@ -510,6 +598,12 @@ class Lazy:
         """Give the quoted str representation"""
         return f"'@{self.formatter} {self.value}'"
 
+    def __getstate__(self):
+        """Pickle without the settings bound by the last evaluation."""
+        state = self.__dict__.copy()
+        state.pop("settings", None)
+        return state
+
     def _dynaconf_encode(self):
         """Encodes this object values to be serializable to json"""
         return f"@{self.formatter} {self.value}"
@@ -644,6 +738,72 @@ def string_casting(value, str_func):
     )
 
 
+class ConverterRegistry(dict):
+    """The converters by key with the matchers built from the keys.
+
+    `_parse_conf_data` runs for every loaded value, the prefix tuple and
+    the combination regex are built once and rebuilt only when a key is
+    added or removed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._matchers = None
+
+    def _changed(self):
+        self._matchers = None
+
+    def matchers(self):
+        """`(prefixes, combination)` for the current keys.
+
+        `prefixes` is the tuple of keys for `str.startswith` and
+        `combination` matches a converter followed by a lazy one e.g.,
+        `@int @jinja`.
+        """
+        if self._matchers is None:
+            keys = tuple(self)
+            combination = re.compile(
+                f"^({'|'.join(map(re.escape, keys))}) "
+                "@(jinja|format|read_file|get)"
+            )
+            self._matchers = (keys, combination)
+        return self._matchers
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._changed()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._changed()
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
 converters = {
     "@str": lambda value: lazy_casting(value, str),
     "@int": lambda value: lazy_casting(value, _safe_int_casting),
@@ -683,6 +843,7 @@ converters = {
     "@none": lambda value: None,
     "@empty": lambda value: empty,
 }
+converters = ConverterRegistry(converters)
 
 
 def apply_converter(converter_key, value, box_settings):
@@ -705,18 +866,61 @@ def add_converter(converter_key, func):
         converter_key = f"@{converter_key}"
 
     converters[converter_key] = wraps(func)(
-        lambda value: value.set_casting(func)
-        if isinstance(value, Lazy)
-        else Lazy(
-            value,
-            casting=func,
-            formatter=BaseFormatter(lambda x, **_: x, converter_key),
+        lambda value: (
+            value.set_casting(func)
+            if isinstance(value, Lazy)
+            else Lazy(
+                value,
+                casting=func,
+                formatter=BaseFormatter(lambda x, **_: x, converter_key),
+            )
         )
     )
 
 
+TOML_INTEGER = re.compile(r"[+-]?(?:0|[1-9](?:_?[0-9])*)")
+"""Decimal TOML integers, parsed by `int` the same way."""
+
+TOML_FLOAT = re.compile(
+    r"[+-]?(?:0|[1-9](?:_?[0-9])*)"
+    r"(?:\.[0-9](?:_?[0-9])*(?:[eE][+-]?[0-9](?:_?[0-9])*)?"
+    r"|[eE][+-]?[0-9](?:_?[0-9])*)"
+)
+"""TOML floats with a fraction and/or an exponent, parsed by `float`."""
+
+# characters a TOML value may start with, anything else is not TOML
+TOML_VALUE_START = frozenset("\"'[{tfin+-0123456789 \t")
+
+
+def parse_toml_literal(data: str):
+    """Parse the common shapes of `data` without the TOML parser.
+
+    Integers, floats, booleans and strings which can't start a TOML value
+    (e.g, `localhost`, `/var/log`) get the same result `parse_with_toml`
+    gives, anything else returns `empty` to be parsed as TOML.
+    """
+    if not data:
+        return data
+    if data[0] not in TOML_VALUE_START:
+        return data  # tomllib fails on the first char, keep the string
+    if data == "true":
+        return True
+    if data == "false":
+        return False
+    if data[0] in "+-0123456789":
+        if TOML_INTEGER.fullmatch(data):
+            return int(data)
+        if TOML_FLOAT.fullmatch(data):
+            return float(data)
+    return empty  # dates, quoted strings, arrays, tables, inf, comments
+
+
 def parse_with_toml(data):
     """Uses TOML syntax to parse data"""
+    if isinstance(data, str):
+        value = parse_toml_literal(data)
+        if value is not empty:
+            return value
     try:  # try tomllib first
         try:
             return tomllib.loads(f"key={data}")["key"]
@@ -757,17 +961,15 @@ def _parse_conf_data(data, tomlfy=False, box_settings=None):
             not in false_values
         )
 
+    prefixes, combination = converters.matchers()
     if (
         castenabled
         and data
         and isinstance(data, str)
-        and data.startswith(tuple(converters.keys()))
+        and data.startswith(prefixes)
     ):
         # Check combination token is used
-        comb_token = re.match(
-            f"^({'|'.join(converters.keys())}) @(jinja|format|read_file|get)",
-            data,
-        )
+        comb_token = combination.match(data)
         if comb_token:
             tokens = comb_token.group(0)
             converter_key_list = tokens.split(" ")
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import time
+import warnings
+from functools import lru_cache
+
+from dynaconf.utils.files import _script_dir
+from dynaconf.utils.files import probes_match
+from dynaconf.utils.watch import stat_signature
+
+MAGIC = b"DYNACONF-SNAPSHOT-1\n"
+
+# files changed this recently may change again within the same mtime
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+@lru_cache(maxsize=1)
+def dynaconf_version():
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "VERSION")
+    with open(path, encoding="utf-8") as version_file:
+        return version_file.read().strip()
+
+
+def snapshot_key(kwargs):
+    """Fingerprint of what a load depends on besides files and environ.
+
+    Arguments with a `repr` which is not stable (e.g. objects showing
+    their address) give a different key on every start, so their
+    snapshot is never reused.
+    """
+    parts = (
+        dynaconf_version(),
+        sys.version,
+        os.getcwd(),
+        _script_dir(),
+        sorted((str(key), repr(value)) for key, value in kwargs.items()),
+    )
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def environ_digest(prefixes, names):
+    """Hash of the environment variables a load can read.
+
+    :param prefixes: env var prefixes, `None` means every variable
+    :param names: other variables to include e.g. the env switcher
+    """
+    variables = sorted(
+        (name, value)
+        for name, value in os.environ.items()
+        if prefixes is None
+        or name in names
+        or name.endswith("_FOR_DYNACONF")
+        or name.startswith(prefixes)
+    )
+    return hashlib.sha256(repr(variables).encode()).hexdigest()
+
+
+def plain(value):
+    """Copy of `value` with nodes turned into dicts and lists, lazy values
+    are kept unevaluated."""
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in dict.items(value)}
+    if isinstance(value, list):
+        return [plain(item) for item in list.__iter__(value)]
+    return value
+
+
+class Snapshot:
+    """A pickled settings store valid while its fingerprint matches.
+
+    The file holds the header, checked without unpickling the data, and
+    then the data. The header has the `key` from `snapshot_key`, the
+    digest of the environment variables and the stat signature of every
+    loaded file and the answers of the lookups for files which may be
+    created later (see `recording_probes`).
+
+    :param path: the snapshot file
+    :param key: the `snapshot_key` of the current settings arguments
+    """
+
+    def __init__(self, path, key):
+        self.path = os.path.abspath(str(path))
+        self.key = key
+        self.header = None
+        self.data = b""
+
+    def read(self):
+        """The data of the snapshot or None if it is missing or stale."""
+        try:
+            with open(self.path, "rb") as snapshot_file:
+                if snapshot_file.read(len(MAGIC)) != MAGIC:
+                    return None
+                header = pickle.load(snapshot_file)
+                if not self.is_fresh(header):
+                    return None
+                return pickle.load(snapshot_file)
+        except FileNotFoundError:
+            return None
+        except Exception as err:  # a broken snapshot is only a cache miss
+            warnings.warn(f"Ignoring settings snapshot {self.path}: {err}")
+            return None
+
+    def is_fresh(self, header):
+        if header["key"] != self.key:
+            return False
+        prefixes, names = header["environ_filter"]
+        if environ_digest(prefixes, names) != header["environ"]:
+            return False
+        for path, signature in header["files"].items():
+            if stat_signature(path) != signature:
+                return False
+        return probes_match(header["probes"])
+
+    def record(self, data, files, probes, environ_filter):
+        """Pickle the state of a load to be written by `write`.
+
+        :param data: picklable data to restore the settings
+        :param files: the files the data was read from
+        :param probes: the answers from `recording_probes`
+        :param environ_filter: `(prefixes, names)` for `environ_digest`
+        """
+        try:
+            self.data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as err:
+            warnings.warn(f"Can't write settings snapshot {self.path}: {err}")
+            return
+        signatures = {
+            os.path.abspath(path): stat_signature(path) for path in files
+        }
+        self.header = {
+            "key": self.key,
+            "environ_filter": environ_filter,
+            "environ": environ_digest(*environ_filter),
+            "files": signatures,
+            "probes": probes,
+        }
+
+    def write(self):
+        """Atomically write the recorded state, return if it was written.
+
+        Nothing is written when a file changed too recently for its stat
+        signature to be trusted, the next start writes it instead.
+        """
+        if self.header is None:
+            return False
+        now = time.time_ns()
+        for signature in self.header["files"].values():
+            if signature is None or now - signature[0] < _RACY_WINDOW_NS:
+                return False
+
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=directory, prefix=".snapshot-"
+            )
+        except OSError as err:
+            warnings.warn(f"Can't write settings snapshot {self.path}: {err}")
+            return False
+        try:
+            with os.fdopen(fd, "wb") as snapshot_file:
+                snapshot_file.write(MAGIC)
+                pickle.dump(
+                    self.header,
+                    snapshot_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+                snapshot_file.write(self.data)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return True
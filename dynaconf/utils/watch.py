@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+import warnings
+from collections.abc import Iterable
+from typing import Callable
+
+# inotify(7) flags
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+)
+
+
+def stat_signature(path):
+    """The (mtime_ns, size, inode) of `path` or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class Inotify:
+    """Minimal ctypes binding to Linux inotify, used only as a wake up
+    signal: which files changed is always decided by `stat_signature`.
+    """
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories: set[str] = set()
+
+    @classmethod
+    def available(cls):
+        return sys.platform.startswith("linux") and bool(
+            ctypes.util.find_library("c")
+        )
+
+    def add_directory(self, directory):
+        if directory in self.directories:
+            return
+        if self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK) < 0:
+            return  # missing dir, the periodic stat check still covers it
+        self.directories.add(directory)
+
+    def wait(self, timeout):
+        """Block up to `timeout` seconds, return True if an event arrived."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        while True:  # drain the queue, events are only a wake up
+            try:
+                if not os.read(self.fd, 65536):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """Watch files and call `callback` with the set of the changed ones.
+
+    :param paths: a callable returning the paths to watch, called on every
+      check so the watched files can grow (e.g. `config.loaded_files`)
+    :param callback: receives a set of changed absolute paths
+    :param interval: seconds between stat checks, with inotify it is also
+      the longest time a change can go unnoticed if an event is missed
+    :param use_inotify: use inotify when available, else poll `os.stat`
+    :param debounce: seconds to wait after an event so bursts of writes
+      (editors, atomic renames) are reloaded once
+    """
+
+    def __init__(
+        self,
+        paths: Callable[[], Iterable[str]],
+        callback: Callable[[set], None],
+        interval: float = 1.0,
+        use_inotify: bool = True,
+        debounce: float = 0.05,
+    ):
+        self.paths = paths
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.inotify = None
+        if use_inotify and Inotify.available():
+            try:
+                self.inotify = Inotify()
+            except OSError:  # pragma: no cover
+                self.inotify = None
+        self.signatures: dict[str, tuple | None] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.check()  # take the initial signatures
+
+    def check(self) -> set[str]:
+        """Compare the current stat signatures and return changed paths."""
+        changed = set()
+        for path in self.paths():
+            path = os.path.abspath(path)
+            signature = stat_signature(path)
+            if path not in self.signatures:
+                self.signatures[path] = signature
+                if self.inotify:
+                    self.inotify.add_directory(os.path.dirname(path))
+                continue
+            if self.signatures[path] != signature:
+                self.signatures[path] = signature
+                changed.add(path)
+        return changed
+
+    def start(self) -> FileWatcher:
+        self._thread = threading.Thread(
+            target=self._run, name="dynaconf-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self.inotify:
+                if self.inotify.wait(self.interval):
+                    self._stop.wait(self.debounce)
+            else:
+                self._stop.wait(self.interval)
+            if self._stop.is_set():
+                break
+            changed = self.check()
+            if not changed:
+                continue
+            try:
+                self.callback(changed)
+            except Exception as err:
+                # keep serving the last good values and keep watching
+                warnings.warn(f"Failed to reload {sorted(changed)}: {err}")
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
+import threading
+import time
+import types
 
 import pytest
 
@@ -9,11 +13,15 @@ from dynaconf import Dynaconf
 from dynaconf import LazySettings
 from dynaconf import ValidationError
 from dynaconf import Validator
+from dynaconf.base import Settings
 from dynaconf.loaders import toml_loader
 from dynaconf.loaders import yaml_loader
+from dynaconf.loaders.base import SourceMetadata
 from dynaconf.nodes import DataDict
 from dynaconf.nodes import DataList
+from dynaconf.nodes import has_lazy
 from dynaconf.strategies.filtering import PrefixFilter
+from dynaconf.utils.parse_conf import DynaconfFormatError
 from dynaconf.utils.parse_conf import true_values
 
 
@@ -1000,6 +1008,730 @@ def test_cache_is_isolated_per_instance():
     assert "KEY" in s2.__core__._cache
 
 
+def test_cached_lazy_keeps_the_dependencies_of_cached_reads():
+    settings = Dynaconf()
+    settings.set("HOST", "localhost")
+    settings.set("URL", "@format http://{this.HOST}")
+    settings.set("ENDPOINT", {"health": "@format {this.URL}/health"})
+    assert settings.URL == "http://localhost"
+    assert settings.ENDPOINT.health == "http://localhost/health"
+    assert settings.get("endpoint.health") == "http://localhost/health"
+
+    settings.set("HOST", "example.com")
+    assert settings.ENDPOINT.health == "http://example.com/health"
+    assert settings.get("endpoint.health") == "http://example.com/health"
+
+
+def test_cached_lazy_follows_in_place_mutation():
+    settings = Dynaconf()
+    settings.set("A", {"b": 1, "c": {"d": 1}})
+    settings.set("X", "@format {this.A.b}")
+    settings.set("Y", "@format {this.A.c.d}")
+    assert settings.get("X") == "1"
+    assert settings.Y == "1"
+
+    settings.A.b = 7
+    settings.A["c"]["d"] = 5
+    assert settings.get("X") == "7"
+    assert settings.Y == "5"
+
+
+def test_in_place_mutation_invalidates_only_its_key():
+    settings = Dynaconf()
+    settings.set("A", {"b": 1, "c": {"d": 1}})
+    settings.set("HOST", "localhost")
+    settings.set("X", "@format {this.A.c.d}")
+    settings.set("URL", "@format {this.HOST}/db")
+    cache = settings.__core__._cache
+    assert settings.X == "1"
+    assert settings.URL == "localhost/db"
+    assert settings.get("a.c.d") == 1
+    assert {"X", "URL", "HOST", "a.c.d"} <= set(cache)
+
+    settings.A.c.d = 2
+    assert "X" not in cache
+    assert "a.c.d" not in cache
+    assert {"URL", "HOST"} <= set(cache)
+    assert settings.X == "2"
+    assert settings.get("a.c.d") == 2
+
+    # the lists read are copies, changing them changes nothing
+    settings.set("ITEMS_LIST", [1, 2])
+    assert settings.ITEMS_LIST == [1, 2]
+    settings.ITEMS_LIST.append(3)
+    assert "X" in cache
+
+
+def test_cache_is_invalidated_per_key():
+    settings = Dynaconf()
+    settings.set("HOST", "localhost")
+    settings.set("PORT", 5432)
+    settings.set("URL", "@format {this.HOST}:{this.PORT}")
+    settings.set("DATABASE", {"name": "db", "options": {"timeout": 1}})
+    cache = settings.__core__._cache
+
+    assert settings.HOST == "localhost"
+    assert settings.URL == "localhost:5432"
+    assert settings["database.options"].timeout == 1
+    assert settings.DATABASE.name == "db"
+    assert {"HOST", "URL", "database.options", "DATABASE"} <= set(cache)
+
+    settings.set("PORT", 6543)
+    assert "HOST" in cache
+    assert "DATABASE" in cache
+    assert "URL" not in cache
+    assert settings.URL == "localhost:6543"
+
+    settings.set("database.options.timeout", 2)
+    assert "HOST" in cache
+    assert "DATABASE" not in cache
+    assert "database.options" not in cache
+    assert settings["database.options"].timeout == 2
+
+    settings.unset("HOST", force=True)
+    assert "HOST" not in cache
+    assert "URL" not in cache
+
+    settings.set("DATABASE__NAME", "other")
+    assert settings.DATABASE.name == "other"
+
+    # switching envs flushes the whole cache
+    cache["NOT_A_SETTING"] = "value"
+    settings.setenv()
+    assert "NOT_A_SETTING" not in cache
+
+
+def test_dotted_get_is_cached():
+    settings = Dynaconf()
+    settings.set("SERVICES", {"payments": {"retry": {"max_attempts": 3}}})
+    settings.set("OTHER", 1)
+    cache = settings.__core__._cache
+    key = "services.payments.retry.max_attempts"
+
+    assert settings.get(key) == 3
+    assert cache[key] == 3
+    assert settings.get(key, cast="@str") == "3"
+    assert settings.get("services.payments.missing") is None
+    assert settings.get("services.payments.missing", "default") == "default"
+    assert "services.payments.missing" not in cache
+
+    settings.set("OTHER", 2)
+    assert key in cache
+
+    settings.set("services.payments.retry.max_attempts", 5)
+    assert key not in cache
+    assert settings.get(key) == 5
+    assert settings.get("SERVICES__payments__retry__max_attempts") == 5
+
+
+def test_dotted_get_follows_in_place_mutation():
+    settings = Dynaconf()
+    settings.set("A", {"b": 1, "c": {"d": 1}})
+    assert settings.get("a.b") == 1
+    assert settings.get("A.c.d") == 1
+
+    settings.A.b = 2
+    settings.A["c"]["d"] = 5
+    assert settings.get("a.b") == 2
+    assert settings.get("A.c.d") == 5
+
+    del settings.A.c["d"]
+    assert settings.get("A.c.d") is None
+
+
+def test_lazy_settings_binds_cached_values():
+    settings = Dynaconf(common=123, other=1)
+    assert settings.COMMON == 123
+    assert vars(settings)["COMMON"] == 123
+
+    settings.set("OTHER", 2)
+    assert vars(settings)["COMMON"] == 123
+
+    settings.COMMON = 456
+    assert "COMMON" not in vars(settings)
+    assert settings.COMMON == 456
+
+    settings.setenv()
+    assert "COMMON" not in vars(settings)
+    assert settings.COMMON == 456
+
+    # a new wrapped Settings is created from the initial kwargs
+    settings.configure()
+    assert "COMMON" not in vars(settings)
+    assert settings.COMMON == 123
+
+
+def test_lazy_settings_unbinds_values_when_wrapped_is_replaced():
+    settings = Dynaconf(FOO=1)
+    assert settings.FOO == 1
+    assert vars(settings)["FOO"] == 1
+
+    settings._wrapped = Settings(FOO=2)
+    assert "FOO" not in vars(settings)
+    assert settings.FOO == 2
+
+
+def test_freeze_returns_read_only_snapshot():
+    settings = Dynaconf(
+        host="localhost",
+        database={"url": "@format {this.HOST}:5432", "tags": ["a", "b"]},
+    )
+    frozen = settings.freeze()
+
+    assert frozen.HOST == "localhost"
+    assert frozen.host == "localhost"
+    assert frozen["HOST"] == "localhost"
+    assert frozen.DATABASE.url == "localhost:5432"
+    assert frozen.DATABASE.URL == "localhost:5432"
+    assert frozen.DATABASE.tags == ("a", "b")
+    assert frozen.get("database.tags.1") == "b"
+    assert frozen.get("database.missing", "default") == "default"
+    assert "database.url" in frozen
+    assert frozen.as_dict()["DATABASE"] == {
+        "url": "localhost:5432",
+        "tags": ["a", "b"],
+    }
+
+    with pytest.raises(AttributeError):
+        frozen.HOST = "other"
+    with pytest.raises(TypeError):
+        frozen.DATABASE["url"] = "other"
+    with pytest.raises(AttributeError):
+        frozen.set("HOST", "other")
+
+    # the snapshot is detached from the settings
+    settings.set("HOST", "example.com")
+    assert frozen.DATABASE.url == "localhost:5432"
+
+
+def test_frozen_option(tmpdir):
+    tmpdir.join("settings.toml").write('name = "frozen"')
+    settings = Dynaconf(
+        settings_file=str(tmpdir.join("settings.toml")), frozen=True
+    )
+    assert settings.NAME == "frozen"
+    assert vars(settings)["NAME"] == "frozen"
+    with pytest.raises(AttributeError):
+        settings.NAME = "other"
+
+
+def test_frozen_settings_keep_the_read_api(tmpdir, monkeypatch):
+    tmpdir.join("settings.toml").write(
+        '[default]\napp_port = "8080"\ndebug = "on"\nratio = "0.5"\n'
+        'data = \'{"a": 1}\'\ndatabase = {host = "localhost"}\n'
+        '[other]\nname = "other"\n'
+    )
+    settings = Dynaconf(
+        settings_file=str(tmpdir.join("settings.toml")),
+        frozen=True,
+        environments=True,
+        validators=[Validator("APP_PORT", must_exist=True)],
+    )
+    assert settings.get("app_port", cast="@int") == 8080
+    assert settings.get("missing", "1", cast="@int") == 1
+    assert settings.get("database.host") == "localhost"
+    assert settings.get("database.host", dotted_lookup=False) is None
+    assert settings.get("DATABASE__host") == "localhost"
+    assert settings["DATABASE__host"] == "localhost"
+    assert "DATABASE__host" in settings
+    assert settings.database.host == "localhost"
+    assert settings.get("Database") == {"host": "localhost"}
+    assert settings.as_int("app_port") == 8080
+    assert settings.as_bool("debug") is True
+    assert settings.as_float("ratio") == 0.5
+    assert settings.as_json("data") == {"a": 1}
+    assert settings.exists("app_port")
+    assert not settings.exists("missing")
+    assert settings.validators[0].names == ("APP_PORT",)
+    settings.validators.validate()
+
+    monkeypatch.setenv("DYNACONF_APP_PORT", "9090")
+    assert settings.get("app_port", fresh=True) == 9090
+    assert settings.get_fresh("app_port") == 9090
+    assert settings.exists("app_port", fresh=True)
+    assert settings.APP_PORT == "8080"  # the snapshot never changes
+
+    other = settings.from_env("other")
+    assert other.NAME == "other"
+    with pytest.raises(AttributeError):
+        other.NAME = "changed"
+
+    with pytest.raises(AttributeError):
+        settings.set("APP_PORT", 1)
+    with pytest.raises(AttributeError):
+        settings.update({"APP_PORT": 1})
+    with pytest.raises(AttributeError):
+        settings.unset("APP_PORT")
+    with pytest.raises(AttributeError):
+        del settings.APP_PORT
+    with pytest.raises(AttributeError):
+        del settings.DATABASE.host
+
+
+def test_resolve_lazy_eager_option(tmpdir):
+    tmpdir.join("settings.toml").write(
+        'host = "localhost"\n'
+        'url = "@format {this.HOST}:5432"\n'
+        'pg_port = "@int @jinja {{ this.URL[-4:] }}"\n'
+        "[database]\n"
+        'hosts = ["@format {this.HOST}", "@get URL"]\n'
+    )
+    settings = Dynaconf(
+        settings_file=str(tmpdir.join("settings.toml")),
+        resolve_lazy="eager",
+    )
+    assert settings.__core__.lazy_resolved
+    assert not has_lazy(settings.store)
+    assert settings.URL == "localhost:5432"
+    assert settings.PG_PORT == 5432
+    assert settings.DATABASE.hosts == ["localhost", "localhost:5432"]
+
+    # resolved values don't follow the keys they were computed from
+    settings.set("HOST", "example.com")
+    assert settings.URL == "localhost:5432"
+
+    # setting a lazy value goes back to evaluating on access
+    settings.set("API", "@format {this.HOST}/api")
+    assert not settings.__core__.lazy_resolved
+    assert settings.API == "example.com/api"
+
+
+def test_resolve_lazy_copies_the_stored_values():
+    settings = Dynaconf(HOST="localhost", environments=False)
+    settings.set(
+        "DATABASE",
+        {"url": "@format {this.HOST}/db", "hosts": ["@format {this.HOST}"]},
+    )
+    settings.resolve_lazy()
+    assert settings.DATABASE.url == "localhost/db"
+
+    # the defaults keep the lazy values, e.g. to be loaded again on reload
+    defaults = settings.__core__.config.defaults["DATABASE"]
+    assert has_lazy(defaults)
+
+    # lists are copies on read, like when lazy values are evaluated
+    hosts = settings.DATABASE.hosts
+    hosts.append("example.com")
+    assert settings.DATABASE.hosts == ["localhost"]
+    settings.get("DATABASE.hosts").append("example.com")
+    assert settings.DATABASE.hosts == ["localhost"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        'a = "@format {this.B}"\nb = "@format {this.A}"',
+        'a = "@format {this.MISSING}"',
+    ],
+)
+def test_resolve_lazy_eager_raises_on_load(tmpdir, data):
+    tmpdir.join("settings.toml").write(data)
+    settings = Dynaconf(
+        settings_file=str(tmpdir.join("settings.toml")),
+        resolve_lazy="eager",
+    )
+    with pytest.raises(DynaconfFormatError):
+        settings.A
+
+
+def test_reload_publishes_a_new_store_atomically(tmpdir):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write('name = "first"\nother = 1')
+    settings = Dynaconf(settings_file=str(settings_file))
+    core = settings.__core__
+    assert settings.NAME == "first"
+
+    seen = []
+
+    def read_from_another_thread():
+        seen.append((settings.get("NAME"), settings.get("OTHER")))
+
+    with core.swapping_store():
+        settings.clean()
+        settings.set("NAME", "second")
+        thread = threading.Thread(target=read_from_another_thread)
+        thread.start()
+        thread.join()
+        assert settings.NAME == "second"
+        assert settings.get("OTHER") is None
+
+    assert seen == [("first", 1)]
+    assert settings.NAME == "second"
+    assert settings.get("OTHER") is None
+
+    settings_file.write('name = "third"')
+    published = settings.store
+    settings.reload()
+    assert settings.store is not published
+    assert settings.NAME == "third"
+    assert published["NAME"] == "second"
+
+
+def test_layers_recompute_only_the_replaced_source():
+    settings = Dynaconf()
+    core = settings.__core__
+    first = SourceMetadata("custom", "first")
+    second = SourceMetadata("custom", "second")
+    settings.set("colors", ["red"], loader_identifier=first)
+    settings.set("name", "first", loader_identifier=first)
+    settings.set("colors", "@merge blue", loader_identifier=second)
+    settings.set("port", 1, loader_identifier=second)
+    assert settings.COLORS == ["red", "blue"]
+    assert settings.NAME == "first"
+    assert settings.PORT == 1
+    assert [source for source, _ in core.layers.layers][-2:] == [first, second]
+
+    with core.replacing_layers(lambda source: source == first):
+        settings.set("colors", ["green"], loader_identifier=first)
+    assert settings.COLORS == ["green", "blue"]
+    assert settings.get("NAME") is None
+    assert core.get_cached("PORT") == 1
+    assert [source for source, _ in core.layers.layers][-2:] == [first, second]
+
+    settings.unset("port")
+    assert "PORT" not in core.layers.roots()
+
+
+def test_layers_keep_one_write_for_repeated_sets():
+    settings = Dynaconf()
+    core = settings.__core__
+    settings.set("STATE", {"count": 0, "items": []})
+    settings.set("STATE.extra", True)
+    layers = len(core.layers)
+    for count in range(100):
+        settings.set("STATE", {"count": count, "items": [count]})
+        settings.set("COUNT", count)
+    assert len(core.layers) == layers
+    assert len(list(core.layers.writes("STATE"))) == 1
+    assert len(list(core.layers.writes("COUNT"))) == 1
+    assert settings.STATE == {"count": 99, "items": [99]}
+
+    core.recompute({"STATE", "COUNT"})
+    assert settings.STATE == {"count": 99, "items": [99]}
+    assert settings.COUNT == 99
+
+    # merges need the writes before them
+    settings.set("STATE", {"merged": 1}, merge=True)
+    settings.set("STATE", {"dynaconf_merge": True, "marked": 1})
+    assert len(list(core.layers.writes("STATE"))) == 3
+    core.recompute({"STATE"})
+    assert settings.STATE.count == 99
+    assert settings.STATE.merged == settings.STATE.marked == 1
+
+
+def test_reload_files_reloads_only_changed_file(tmpdir, monkeypatch):
+    first = tmpdir.join("first.toml")
+    first.write('name = "first"\nshared = 1\nfrom_env = "file"')
+    second = tmpdir.join("second.toml")
+    second.write("shared = 2\ngone = true")
+    monkeypatch.setenv("DYNACONF_FROM_ENV", "env")
+    settings = Dynaconf(settings_files=[str(first), str(second)])
+    assert settings.SHARED == 2
+    assert settings.GONE is True
+    assert settings.FROM_ENV == "env"
+    cached_name = settings.NAME
+
+    second.write('shared = 3\nadded = "yes"\nfrom_env = "second"')
+    settings.reload_files(str(second))
+    assert settings.SHARED == 3
+    assert settings.ADDED == "yes"
+    assert settings.get("GONE") is None
+    assert settings.FROM_ENV == "env"
+    assert settings.NAME is cached_name
+
+    second.write("")
+    settings.reload_files([str(second)])
+    assert settings.SHARED == 1
+    assert settings.get("ADDED") is None
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch_reloads_changed_files(tmpdir, use_inotify):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write('name = "first"')
+    settings = Dynaconf(settings_files=[str(settings_file)])
+    assert settings.NAME == "first"
+
+    watcher = settings.watch(interval=0.05, use_inotify=use_inotify)
+    try:
+        settings_file.write('name = "second"')
+        deadline = time.monotonic() + 5
+        while settings.NAME != "second" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert settings.NAME == "second"
+    finally:
+        watcher.stop()
+    assert not watcher.running
+
+
+def test_snapshot_file_restores_the_loaded_settings(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write(
+        'a = 1\nb = "@format {this.a}x"\nnested = [1, {c = 2}]'
+    )
+    monkeypatch.setenv("DYNACONF_COLORS", "@merge [1]")
+    snapshot_file = tmpdir.join("cache", "settings.snapshot")
+
+    def load():
+        settings = Dynaconf(
+            settings_files=["settings.toml"],
+            snapshot_file=str(snapshot_file),
+        )
+        settings.get("A")  # loads it
+        return settings
+
+    def age(path):
+        past = time.time() - 60
+        os.utime(str(path), (past, past))
+
+    load()
+    assert not snapshot_file.exists()  # too recent to trust its mtime
+    age(settings_file)
+    loaded = load()
+    assert snapshot_file.exists()
+
+    def execute_loaders(self, *args, **kwargs):
+        raise AssertionError("the snapshot must be used")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Settings, "execute_loaders", execute_loaders)
+        restored = load()
+    assert restored.as_dict() == loaded.as_dict()
+    assert restored.B == "1x"
+    assert restored.COLORS == [1]
+    assert isinstance(restored.NESTED[1], DataDict)
+    assert restored.NESTED[1].c == 2
+    assert list(restored.loaded_by_loaders) == list(loaded.loaded_by_loaders)
+    assert restored.__core__.config.loaded_files == [str(settings_file)]
+
+    local_file = tmpdir.join("settings.local.toml")
+    local_file.write("a = 3")
+    age(local_file)
+    assert load().B == "3x"  # found a file missing when it was taken
+
+    monkeypatch.setenv("DYNACONF_A", "4")
+    assert load().B == "4x"
+
+
+@pytest.mark.parametrize("hooks", [False, True])
+def test_snapshot_file_is_not_used_when_python_code_is_loaded(
+    tmpdir, monkeypatch, hooks
+):
+    monkeypatch.chdir(tmpdir)
+    if hooks:
+        settings_file = tmpdir.join("settings.toml")
+        settings_file.write("a = 1")
+
+        def post_hook(settings):
+            return {"DB": os.environ.get("DATABASE_URL", "none")}
+
+        kwargs = {"settings_files": ["settings.toml"]}
+        kwargs["post_hooks"] = [post_hook]
+    else:
+        settings_file = tmpdir.join("settings.py")
+        settings_file.write(
+            'import os\nDB = os.environ.get("DATABASE_URL", "none")'
+        )
+        kwargs = {"settings_files": ["settings.py"]}
+    past = time.time() - 60
+    os.utime(str(settings_file), (past, past))
+    snapshot_file = tmpdir.join("settings.snapshot")
+
+    def load():
+        return Dynaconf(snapshot_file=str(snapshot_file), **kwargs).DB
+
+    assert load() == "none"
+    assert load() == "none"
+    assert not snapshot_file.exists()
+    monkeypatch.setenv("DATABASE_URL", "pg://new")
+    assert load() == "pg://new"
+
+
+def test_aget_fresh_keeps_serving_the_value_while_loading(tmpdir):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write("count = 1")
+    settings = Dynaconf(settings_file=str(settings_file))
+    assert settings.COUNT == 1
+    settings_file.write("count = 2")
+
+    async def main():
+        seen = []
+        refresh = asyncio.ensure_future(settings.aget_fresh("count"))
+        while not refresh.done():
+            seen.append(settings.get("COUNT"))
+            await asyncio.sleep(0)
+        return await refresh, seen
+
+    value, seen = asyncio.run(main())
+    assert value == 2
+    assert seen and set(seen) <= {1, 2}
+    assert settings.COUNT == 2
+
+
+def test_async_loading_writes_under_the_write_lock(tmpdir, monkeypatch):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write('name = "first"\ncount = 1')
+    settings = Dynaconf(settings_file=str(settings_file))
+    core = settings.__core__
+    assert settings.NAME == "first"
+    settings_file.write('name = "second"\ncount = 2')
+
+    owned = []
+    for name in ("clear_cache", "invalidate_cached"):
+        method = getattr(core, name)
+
+        def spy(*args, _method=method):
+            owned.append(core._write_lock._is_owned())
+            return _method(*args)
+
+        monkeypatch.setattr(core, name, spy)
+
+    assert asyncio.run(settings.aget_fresh("count")) == 2
+    assert owned and all(owned)
+    owned.clear()
+    asyncio.run(settings.areload())
+    assert settings.NAME == "second"
+    assert owned and all(owned)
+
+
+def test_aload_looks_for_files_next_to_the_script(tmpdir, monkeypatch):
+    from dynaconf.utils import files
+
+    app_dir = tmpdir.mkdir("app")
+    app_dir.join("settings.toml").write('name = "app"')
+    main = types.ModuleType("__main__")
+    main.__file__ = str(app_dir.join("main.py"))
+    monkeypatch.setitem(sys.modules, "__main__", main)
+    monkeypatch.chdir(tmpdir.mkdir("elsewhere"))
+    files._main_script_dir.cache_clear()
+    try:
+        settings = Dynaconf(
+            settings_files=["settings.toml"], dynaconf_skip_loaders=True
+        )
+        asyncio.run(settings.aload())
+        assert settings.NAME == "app"
+
+        # without a `__main__` file the caller's frames are used, not the
+        # ones of the worker threads
+        del main.__file__
+        files._main_script_dir.cache_clear()
+
+        async def script_dir_in_a_thread():
+            with files.pinned_script_dir():
+                return await asyncio.to_thread(files._script_dir)
+
+        in_thread = asyncio.run(script_dir_in_a_thread())
+        assert in_thread == files._script_dir()
+    finally:
+        files._main_script_dir.cache_clear()
+
+
+def test_async_loading_api(tmpdir):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write('name = "first"\ncount = 1')
+    settings = Dynaconf(settings_file=str(settings_file))
+    assert settings.NAME == "first"
+
+    settings_file.write('name = "second"\ncount = 2')
+    assert asyncio.run(settings.aget_fresh("count")) == 2
+    assert settings.NAME == "first"
+
+    asyncio.run(settings.areload())
+    assert settings.NAME == "second"
+
+    calls = []
+
+    async def aload(obj, env=None, silent=True, key=None, validate=False):
+        await asyncio.sleep(0)
+        calls.append("aload")
+        obj.set("FROM_ASYNC", env)
+
+    def load(obj, env=None, silent=True, key=None, validate=False):
+        calls.append("load")
+        obj.set("FROM_SYNC", env)
+
+    async_loader = types.ModuleType("async_loader")
+    async_loader.load = load
+    async_loader.aload = aload
+    sync_loader = types.ModuleType("sync_loader")
+    sync_loader.load = load
+
+    asyncio.run(settings.aload(loaders=[async_loader, sync_loader]))
+    assert calls == ["aload", "load"]
+    assert settings.FROM_ASYNC == settings.FROM_SYNC == "MAIN"
+
+
+def test_fresh_vars_ttl_revalidates_in_background(tmpdir, monkeypatch):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write('token = "first"')
+    settings = Dynaconf(
+        settings_file=str(settings_file),
+        fresh_vars=["token"],
+        fresh_vars_ttl=60,
+    )
+    core = settings.__core__
+    assert settings.TOKEN == "first"
+
+    # served from the store while the ttl is not expired
+    settings_file.write('token = "second"')
+    assert settings.TOKEN == "first"
+
+    release = threading.Event()
+    refresh = core._refresh
+
+    def slow_refresh(key):
+        release.wait()
+        refresh(key)
+
+    monkeypatch.setattr(core, "_refresh", slow_refresh)
+    core._refreshed_at["TOKEN"] -= 120
+
+    # the stale value is served while a single refresher runs
+    assert settings.TOKEN == "first"
+    assert settings.TOKEN == "first"
+    refreshers = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name == "dynaconf-refresh-TOKEN"
+    ]
+    assert len(refreshers) == 1
+
+    release.set()
+    refreshers[0].join()
+    assert settings.TOKEN == "second"
+
+
+def test_fresh_vars_ttl_refresh_waits_for_other_writers(tmpdir):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write('token = "first"')
+    settings = Dynaconf(
+        settings_file=str(settings_file),
+        fresh_vars=["token"],
+        fresh_vars_ttl=60,
+    )
+    core = settings.__core__
+    assert settings.TOKEN == "first"
+    settings_file.write('token = "second"')
+    core._refreshed_at["TOKEN"] -= 120
+    layers = len(core.layers)
+
+    # a writer (e.g, a reload) holds the lock, the refresh can't commit
+    with core._write_lock:
+        assert settings.TOKEN == "first"
+        [refresher] = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "dynaconf-refresh-TOKEN"
+        ]
+        refresher.join(0.2)
+        assert refresher.is_alive()
+        assert len(core.layers) == layers
+
+    refresher.join()
+    assert settings.TOKEN == "second"
+
+
 def test_from_env_method(clean_env, tmpdir):
     data = {
         "default": {"a_default": "From default env"},
@@ -1120,6 +1852,23 @@ def test_envless_load_file(tmpdir):
     assert settings.VALUE == "Envless value"
 
 
+def test_load_file_records_the_caller(tmpdir):
+    settings_file = tmpdir.join("settings.toml")
+    settings_file.write('name = "caller"')
+    settings = Dynaconf()
+    settings.load_file(str(settings_file))  # the caller line
+    source = list(settings.loaded_by_loaders)[-1]
+    assert source.loader.startswith(f"load_file@{__file__}:")
+    lineno = int(source.loader.rsplit(":", 1)[1])
+    with open(__file__) as test_file:
+        assert "# the caller line" in test_file.readlines()[lineno - 1]
+
+    settings = Dynaconf(track_load_file_caller=False)
+    settings.load_file(str(settings_file))
+    assert settings.NAME == "caller"
+    assert list(settings.loaded_by_loaders)[-1].loader == "load_file"
+
+
 def test_load_file_missing_path_with_silent_false(tmpdir):
     """load_file raises FileNotFoundError when path is missing and silent=False."""
     settings = Dynaconf()
@@ -1810,6 +2559,34 @@ def test_get_with_sysenv_fallback_local_overrides():
     assert not settings.get("another_test", sysenv_fallback=False)
 
 
+def test_resolved_options_follow_internal_keys(monkeypatch):
+    """
+    When an internal `*_FOR_DYNACONF` key is set or unset
+    Should rebuild the options snapshot used by `get`
+    """
+    settings = Dynaconf(sysenv_fallback=False)
+    monkeypatch.setenv("OPTIONS_TEST_KEY", "OPTIONS_VALUE")
+    options = settings.__core__.options
+    assert options.sysenv_fallback is False
+    assert options.nested_separator == "__"
+    assert not settings.get("options_test_key")
+
+    settings.set("SYSENV_FALLBACK_FOR_DYNACONF", ["options_test_key"])
+    assert settings.__core__.options is not options
+    assert settings.__core__.options.sysenv_fallback_keys == {
+        "OPTIONS_TEST_KEY"
+    }
+    assert settings.get("options_test_key") == "OPTIONS_VALUE"
+
+    settings.set("NESTED_SEPARATOR_FOR_DYNACONF", "::")
+    settings.set("parent", {"child": 1})
+    assert settings.get("parent::child") == 1
+
+    settings.unset("NESTED_SEPARATOR_FOR_DYNACONF", force=True)
+    assert settings.__core__.options.nested_separator is None
+    assert settings.get("parent::child") is None
+
+
 # issue #965
 def test_no_extra_values_in_nested_structure():
     settings = Dynaconf()
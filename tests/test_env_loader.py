@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import importlib
 import os
 import sys
+import time
 from collections import OrderedDict
 from os import environ
 
 import pytest
 
+from dynaconf import default_settings
 from dynaconf import settings  # noqa
 from dynaconf.loaders.env_loader import load
 from dynaconf.loaders.env_loader import load_from_env
@@ -105,6 +108,45 @@ def test_dotenv_loader():
     assert settings.DOTENV_NOTE is None
 
 
+def test_default_settings_reload_is_memoized(tmpdir, monkeypatch):
+    def reload_module(module):
+        raise AssertionError("the defaults must come from the cache")
+
+    with monkeypatch.context() as patch:
+        patch.setenv("ENV_FOR_DYNACONF", "staging")
+        default_settings.reload()
+        assert default_settings.ENV_FOR_DYNACONF == "staging"
+        default_settings.SETTINGS_FILE_FOR_DYNACONF.append("changed.toml")
+
+        with monkeypatch.context() as no_reload:
+            no_reload.setattr(importlib, "reload", reload_module)
+            default_settings.reload()
+        assert default_settings.ENV_FOR_DYNACONF == "staging"
+        assert default_settings.SETTINGS_FILE_FOR_DYNACONF == []
+
+        patch.setenv("ENV_FOR_DYNACONF", "production")
+        default_settings.reload()
+        assert default_settings.ENV_FOR_DYNACONF == "production"
+
+        dotenv_file = tmpdir.join(".env")
+        dotenv_file.write("DOTENV_MEMO=1")
+        past = time.time() - 60
+        os.utime(str(dotenv_file), (past, past))
+        obj = {"DOTENV_PATH_FOR_DYNACONF": str(dotenv_file)}
+        patch.setenv("DOTENV_MEMO", "")
+        patch.delenv("DOTENV_MEMO")
+        default_settings.start_dotenv(obj)
+        assert environ["DOTENV_MEMO"] == "1"
+        del environ["DOTENV_MEMO"]
+        default_settings.start_dotenv(obj)  # loads it again
+        assert environ["DOTENV_MEMO"] == "1"
+
+        with monkeypatch.context() as no_load:
+            no_load.setattr(default_settings, "DotEnv", None)
+            default_settings.start_dotenv(obj)
+    default_settings.reload()
+
+
 def test_get_fresh():
     assert settings.MUSTBEFRESH == "first"
     environ["DYNACONF_MUSTBEFRESH"] = "second"
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from textwrap import dedent
 
@@ -37,3 +38,126 @@ def test_loaders_raise_on_syntax_error(file_factory, filename, silent):
     settings = Dynaconf()
     with pytest.raises(Exception):
         settings.load_file(path=filepath, silent=silent)
+
+
+@pytest.mark.parametrize(
+    "filename,content,changed",
+    [
+        ("f.yml", "a:\n  b: [1, 2]\n", "a:\n  b: [3, 4]\n"),
+        ("f.toml", "[a]\nb = [1, 2]\n", "[a]\nb = [3, 4]\n"),
+        ("f.json", '{"a": {"b": [1, 2]}}', '{"a": {"b": [3, 4]}}'),
+    ],
+)
+def test_parsed_files_are_cached_until_stat_changes(
+    file_factory, monkeypatch, filename, content, changed
+):
+    """Unchanged files are parsed once and reused with a fresh copy."""
+    from dynaconf.loaders import base
+
+    filepath = file_factory(filename, content)
+    past = os.stat(filepath).st_mtime - 10
+    os.utime(filepath, (past, past))
+
+    base.clear_parsed_files_cache()
+    calls = []
+    real_open = open
+
+    def tracking_open(file, *args, **kwargs):
+        if file == filepath:
+            calls.append(file)
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+
+    settings = Dynaconf(settings_files=filepath, environments=False)
+    assert settings.A.B == [1, 2]
+    settings.A.B.append(9)
+    other = Dynaconf(settings_files=filepath, environments=False)
+    assert other.A.B == [1, 2]
+    assert len(calls) == 1
+    assert filepath in other.__core__.config.loaded_files
+
+    # same size, new mtime, the file is parsed again
+    with real_open(filepath, "w") as f:
+        f.write(changed)
+    os.utime(filepath, (past + 5, past + 5))
+    assert Dynaconf(settings_files=filepath, environments=False).A.B == [3, 4]
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parse_workers_keep_the_merge_order(tmp_path, monkeypatch, executor):
+    """Files parsed concurrently are merged in the same order."""
+    from dynaconf import loaders
+    from dynaconf.loaders import base
+
+    prefetched = []
+
+    def prefetch_files(files, *args, **kwargs):
+        prefetched.extend(files)
+        return base.prefetch_files(files, *args, **kwargs)
+
+    monkeypatch.setattr(loaders, "prefetch_files", prefetch_files)
+
+    conf_d = tmp_path / "conf.d"
+    conf_d.mkdir()
+    for i in range(6):
+        merge = "  - dynaconf_merge\n" if i else ""
+        (conf_d / f"{i:02}.yaml").write_text(
+            f"last: {i}\nitems:\n{merge}  - {i}\nfile_{i}: true\n"
+        )
+
+    def load(**kwargs):
+        settings = Dynaconf(
+            root_path=str(tmp_path),
+            includes=["conf.d/*.yaml"],
+            environments=False,
+            **kwargs,
+        )
+        return settings.as_dict()
+
+    base.clear_parsed_files_cache()
+    expected = load()
+    base.clear_parsed_files_cache()
+    parallel = load(parse_workers=2, parse_executor=executor)
+    assert parallel == expected
+    assert parallel["LAST"] == 5
+    assert parallel["ITEMS"] == [0, 1, 2, 3, 4, 5]
+    assert len(prefetched) == 6
+    assert not base._prefetched  # every prefetched file was used
+
+
+def test_parse_workers_skip_the_files_already_parsed(tmp_path, monkeypatch):
+    """Unchanged files in the parsed files cache are not prefetched."""
+    from dynaconf.loaders import base
+
+    parsed = []
+    parse_file = base._parse_file
+
+    def counting_parse_file(source_file, *args):
+        parsed.append(source_file)
+        return parse_file(source_file, *args)
+
+    monkeypatch.setattr(base, "_parse_file", counting_parse_file)
+
+    for i in range(3):
+        path = tmp_path / f"{i}.yaml"
+        path.write_text(f"value_{i}: {i}\n")
+        past = os.stat(path).st_mtime - 10
+        os.utime(path, (past, past))
+
+    def load():
+        settings = Dynaconf(
+            root_path=str(tmp_path),
+            includes=["*.yaml"],
+            environments=False,
+            parse_workers=2,
+        )
+        return settings.as_dict()
+
+    base.clear_parsed_files_cache()
+    first = load()
+    assert len(parsed) == 3
+    assert load() == first
+    assert len(parsed) == 3  # served from the parsed files cache
+    assert not base._prefetched
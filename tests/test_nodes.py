@@ -292,6 +292,46 @@ def test_mutable_operations():
     assert isinstance(li[0], DataDict) and isinstance(li[1], DataDict)
 
 
+def test_casing_index_is_maintained():
+    di = DataDict({"Foo": 1, "my key": 2})
+    assert di["FOO"] == 1
+    assert di.get("my_key") == 2
+    assert "foo" in di
+
+    di["BAR"] = 3
+    di.update({"Zaz": 4})
+    di.setdefault("Qux", 5)
+    assert di.bar == 3
+    assert di.zaz == 4
+    assert di.get("QUX") == 5
+    di |= {"Spam": 6}
+    assert isinstance(di, DataDict)
+    assert di.spam == 6
+    merged = di | {"Eggs": 7}
+    assert type(merged) is dict
+    assert merged["Eggs"] == 7
+
+    del di["foo"]
+    assert "Foo" not in di
+    assert di.get("foo") is None
+    di.pop("BAR")
+    assert "bar" not in di
+    di.clear()
+    assert "zaz" not in di
+    assert di.__meta__.casing == {}
+
+
+def test_casing_index_keeps_first_inserted_key():
+    di = DataDict({"key": 1, "KEY": 2})
+    assert di["Key"] == 1
+    del di["key"]
+    assert di["Key"] == 2
+
+    copied = copy.deepcopy(DataDict({"Foo": 1}))
+    assert copied["foo"] == 1
+    assert copied.__meta__.casing == {"foo": ["Foo"]}
+
+
 def test_repr():
     """Test that no unexpected internal attributes shows up."""
     di = DataDict({"foo": 123})
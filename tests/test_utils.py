@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import inspect
 import json
 import os
 import sys
+import types
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import dedent
 
@@ -28,13 +31,18 @@ from dynaconf.utils import trimmed_split
 from dynaconf.utils import upperfy
 from dynaconf.utils.files import find_file
 from dynaconf.utils.files import get_local_filename
+from dynaconf.utils.parse_conf import _compile_jinja
+from dynaconf.utils.parse_conf import _parse_format
 from dynaconf.utils.parse_conf import boolean_fix
+from dynaconf.utils.parse_conf import converters
 from dynaconf.utils.parse_conf import evaluate_lazy_format
 from dynaconf.utils.parse_conf import Formatters
 from dynaconf.utils.parse_conf import Lazy
 from dynaconf.utils.parse_conf import parse_conf_data
+from dynaconf.utils.parse_conf import parse_with_toml
 from dynaconf.utils.parse_conf import try_to_encode
 from dynaconf.utils.parse_conf import unparse_conf_data
+from dynaconf.vendor import tomllib
 
 
 def test_isnamedtupleinstance():
@@ -116,6 +124,83 @@ def test_find_file(tmpdir):
     ) == os.path.join(str(tmpdir), ".env")
 
 
+def test_find_file_caches_the_search_tree(tmpdir, monkeypatch):
+    from dynaconf.utils import files
+
+    main_file = sys.modules["__main__"].__file__
+    script_dir = os.path.dirname(os.path.abspath(main_file))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("inspect.stack() must not be used")
+
+    monkeypatch.setattr(inspect, "stack", fail)
+    monkeypatch.chdir(tmpdir)
+    files._search_tree.cache_clear()
+    tmpdir.join("settings.toml").write("a = 1")
+
+    expected = os.path.join(str(tmpdir), "settings.toml")
+    assert find_file("settings.toml") == expected
+    assert find_file("settings.toml") == expected
+    assert files._search_tree.cache_info().hits == 1
+    assert str(tmpdir) in files.SEARCHTREE
+    assert files._script_dir() == script_dir
+
+
+def test_script_dir_is_the_same_in_other_threads(monkeypatch):
+    from dynaconf.utils import files
+
+    main = types.ModuleType("__main__")
+    main.__file__ = os.path.join("/srv", "app", "main.py")
+    monkeypatch.setitem(sys.modules, "__main__", main)
+    files._main_script_dir.cache_clear()
+    try:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            in_thread = pool.submit(files._script_dir).result()
+        assert (
+            in_thread
+            == files._script_dir()
+            == os.path.abspath(os.path.join("/srv", "app"))
+        )
+
+        # without a file, e.g. the REPL, the outermost frame is used
+        del main.__file__
+        files._main_script_dir.cache_clear()
+        frame = sys._getframe()
+        while frame.f_back is not None:
+            frame = frame.f_back
+        outermost = os.path.abspath(frame.f_code.co_filename)
+        assert files._script_dir() == os.path.dirname(outermost)
+    finally:
+        files._main_script_dir.cache_clear()
+
+
+def test_cached_listings_scan_each_directory_once(tmpdir, monkeypatch):
+    from dynaconf.utils import files
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join("settings.toml").write("a = 1")
+    expected = os.path.join(str(tmpdir), "settings.toml")
+    assert find_file("settings.toml") == expected  # warm the search tree
+
+    scanned = []
+    scandir = os.scandir
+    monkeypatch.setattr(
+        os, "scandir", lambda path: scanned.append(path) or scandir(path)
+    )
+    with files.cached_listings():
+        with monkeypatch.context() as m:
+            m.setattr(os.path, "exists", lambda path: pytest.fail(path))
+            assert find_file("settings.toml") == expected
+            assert find_file("missing.toml") == ""
+            assert find_file("missing.local.toml") == ""
+        assert scanned and len(scanned) == len(set(scanned))
+
+        # the listing is kept for the whole load cycle
+        tmpdir.join("late.toml").write("")
+        assert find_file("late.toml") == ""
+    assert find_file("late.toml") == os.path.join(str(tmpdir), "late.toml")
+
+
 def test_casting_str(settings):
     res = parse_conf_data("@str 7")
     assert isinstance(res, str) and res == "7"
@@ -241,6 +326,26 @@ def test_tomlfy_unparsable(test_input, settings):
     )
 
 
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        *("", "0", "-0", "+12", "1_000", "01", "1__0", "1_", "0x1F"),
+        *("1.5", "-0.5e-10", "1E+05", "1e06", "1.", ".5", "01.5", "1e999"),
+        *("true", "false", "True", "trueish", "true # on", "inf", "nan"),
+        *("localhost", "/var/log", "a b", "1979-05-27", "07:32:00", " 1"),
+        *("'quoted'", "[1, 2]", "{a=1}", "42 # answer", "8080/tcp"),
+    ],
+)
+def test_toml_literals_parse_as_toml(test_input):
+    try:
+        expected = tomllib.loads(f"key={test_input}")["key"]
+    except tomllib.TOMLDecodeError:
+        expected = test_input
+    result = parse_with_toml(test_input)
+    assert type(result) is type(expected)
+    assert result == expected or result != result  # nan
+
+
 def test_missing_sentinel():
     # The missing singleton should always compare truthfully to itself
     assert missing == missing
@@ -431,6 +536,23 @@ def test_lazy_format_class_jinja():
     assert value(settings) == "foo/bar"
 
 
+def test_lazy_format_templates_are_compiled_once():
+    jinja_value = Lazy(
+        "{{this.FOO}}/{{this.BAR}}/jinja", Formatters.jinja_formatter
+    )
+    format_value = Lazy("{this[FOO]}/{this[BAR]}/format")
+    compiles = _compile_jinja.cache_info().misses
+    parses = _parse_format.cache_info().misses
+
+    for bar in ("bar", "baz", "qux"):
+        settings = {"FOO": "foo", "BAR": bar}
+        assert jinja_value(settings) == f"foo/{bar}/jinja"
+        assert format_value(settings) == f"foo/{bar}/format"
+
+    assert _compile_jinja.cache_info().misses == compiles + 1
+    assert _parse_format.cache_info().misses == parses + 1
+
+
 def test_evaluate_lazy_format_decorator_jinja(settings):
     class Settings:
         FOO = "foo"
@@ -523,6 +645,23 @@ def test_add_converter_path_example(tmp_path):
     assert isinstance(settings.my_path, Path)
 
 
+def test_converter_matchers_follow_the_registry(settings):
+    """Assert the cached matchers are rebuilt when converters change"""
+    prefixes, combination = converters.matchers()
+    assert converters.matchers()[1] is combination
+    assert "@double" not in prefixes
+
+    add_converter("double", lambda value: int(value) * 2)
+    assert "@double" in converters.matchers()[0]
+    settings.set("NUM", 21)
+    settings.set("DOUBLED", "@double @format {this.NUM}")
+    assert settings.DOUBLED == 42
+
+    del converters["@double"]
+    assert "@double" not in converters.matchers()[0]
+    assert parse_conf_data("@double 1", box_settings=settings) == "@double 1"
+
+
 def test_boolean_fix():
     """Assert boolean fix works"""
     assert boolean_fix("True") == "true"
@@ -1140,6 +1279,53 @@ def test_format_circular_reference(settings):
         settings.A
 
 
+def test_lazy_format_result_is_memoized_by_dependencies(settings):
+    settings.set("DB_HOST", "localhost")
+    settings.set("DB_PORT", 5432)
+    settings.set("OTHER", "value")
+    settings.set("DATABASE", {"url": "@format {this.DB_HOST}:{this.DB_PORT}"})
+    lazy = settings.store["DATABASE"].get("url", bypass_eval=True)
+    core = settings.__core__
+
+    assert settings.DATABASE.url == "localhost:5432"
+    assert core.get_lazy_cached(lazy) == (
+        "localhost:5432",
+        {"DB_HOST", "DB_PORT"},
+    )
+
+    # unrelated keys keep the cached result
+    settings.set("OTHER", "changed")
+    assert core.get_lazy_cached(lazy)[0] == "localhost:5432"
+
+    settings.set("DB_PORT", 6543)
+    with pytest.raises(KeyError):
+        core.get_lazy_cached(lazy)
+    assert settings.get("database.url") == "localhost:6543"
+
+    settings.unset("DB_HOST", force=True)
+    with pytest.raises(DynaconfFormatError):
+        settings.DATABASE.url
+
+
+def test_lazy_format_dependencies_propagate(settings):
+    settings.set("HOST", "localhost")
+    settings.set("URL", "@format http://{this.HOST}")
+    settings.set("ENDPOINT", {"health": "@format {this.URL}/health"})
+
+    assert settings.ENDPOINT.health == "http://localhost/health"
+    settings.set("HOST", "example.com")
+    assert settings.ENDPOINT.health == "http://example.com/health"
+
+
+def test_lazy_format_reading_env_is_not_memoized(settings, monkeypatch):
+    monkeypatch.setenv("LAZY_MEMO_THING", "first")
+    settings.set("DATA", {"thing": "@format {env[LAZY_MEMO_THING]}"})
+    assert settings.DATA.thing == "first"
+
+    monkeypatch.setenv("LAZY_MEMO_THING", "second")
+    assert settings.DATA.thing == "second"
+
+
 def test_string_utils_with_numbers(settings):
     """Test string utilities with numeric input"""
     settings.set("NUM", "@upper 42")
@@ -1297,6 +1483,41 @@ def test_read_file_os_error(tmp_path, monkeypatch):
             settings.SECRET
 
 
+def test_read_file_content_is_cached_until_the_file_changes(
+    tmp_path, monkeypatch
+):
+    filename = tmp_path / "secret"
+    filename.write_text("first")
+    os.utime(filename, ns=(10**18, 10**18))
+    settings = Dynaconf()
+    settings.set("SECRET", f"@read_file {filename}")
+    assert settings.SECRET == "first"
+
+    reads = []
+    original_open = open
+
+    def counting_open(*args, **kwargs):
+        reads.append(args[0])
+        return original_open(*args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    assert settings.SECRET == "first"
+    assert reads == []
+
+    filename.write_text("second")
+    os.utime(filename, ns=(15 * 10**17, 15 * 10**17))
+    assert settings.SECRET == "second"
+    assert len(reads) == 1
+
+    # within the revalidate interval the file is not checked at all
+    settings.set("READ_FILE_REVALIDATE_FOR_DYNACONF", 60)
+    filename.write_text("third")
+    os.utime(filename, ns=(10**18, 10**18))
+    assert settings.SECRET == "second"
+    settings.set("READ_FILE_REVALIDATE_FOR_DYNACONF", 0)
+    assert settings.SECRET == "third"
+
+
 def test_lazy_with_custom_function_formatter():
     """Test Lazy with custom function (not BaseFormatter)"""
     from dynaconf.utils.parse_conf import Lazy
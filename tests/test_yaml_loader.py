@@ -578,3 +578,40 @@ def test_empty_yaml_key_overriding(tmpdir):
             _settings.level1.key6
             _settings.level1.key7
             _settings.level1.KEY8
+
+
+@pytest.mark.parametrize("yaml_loader", ["safe_load", "safe_load_all"])
+def test_libyaml_backend_loads_the_same_data(yaml_loader):
+    pytest.importorskip("yaml")
+    from dynaconf.loaders.yaml_loader import LibYAMLReader
+
+    if not LibYAMLReader.available(yaml_loader):
+        pytest.skip("PyYAML without libyaml")
+
+    data = {}
+    for backend in ("ruamel", "libyaml"):
+        settings = LazySettings(
+            environments=True,
+            ENV_FOR_DYNACONF="PRODUCTION",
+            YAML_LOADER_FOR_DYNACONF=yaml_loader,
+            YAML_BACKEND_FOR_DYNACONF=backend,
+        )
+        multi_doc = yaml_loader.endswith("_all")
+        load(settings, filename=MULTIDOC if multi_doc else YAML)
+        data[backend] = settings.as_dict()
+    assert data["libyaml"] == data["ruamel"]
+    assert "HOST" in data["libyaml"]
+
+
+def test_libyaml_backend_reader_can_be_pickled():
+    import pickle
+
+    pytest.importorskip("yaml")
+    from dynaconf.loaders.yaml_loader import LibYAMLReader
+
+    if not LibYAMLReader.available("safe_load"):
+        pytest.skip("PyYAML without libyaml")
+
+    reader = pickle.loads(pickle.dumps(LibYAMLReader("safe_load_all")))
+    assert reader.__name__ == "safe_load_all"
+    assert list(reader("a: 1\n---\nb: 2")) == [{"a": 1}, {"b": 2}]